@@ -0,0 +1,24 @@
+"""Fixtures shared by every test suite in the workspace."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from praecepta.infra.fastapi.app_factory import _discover_cached
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(autouse=True)
+def _clear_discovery_cache() -> Iterator[None]:
+    """Give each test a fresh entry-point discovery cache.
+
+    ``create_app`` memoizes discovery per process; clearing it keeps
+    contributions found (or excluded) by one test out of the next.
+    """
+    _discover_cached.cache_clear()
+    yield
+    _discover_cached.cache_clear()
@@ -3,17 +3,63 @@
 L1: In-memory (cachetools.TTLCache, 5min TTL, per-process)
 L2: Redis (1hr TTL, shared across processes)
 
-Cache key format: tenant:{tenant_id}:config:{config_key}
+L1 keeps an index of cached keys per tenant, so tenant-wide invalidation
+touches only that tenant's entries instead of scanning every cached key.
+
+L2 cache key format: tenant:{tenant_id}:config:{config_key}
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+from functools import partial
 from typing import Any
 
 from cachetools import TTLCache  # type: ignore[import-untyped]
 
 
+class _TenantIndexedTTLCache(TTLCache):  # type: ignore[misc,type-arg,unused-ignore]
+    """TTLCache keyed by ``(tenant_id, key)`` that indexes keys per tenant.
+
+    The index is updated on every insert, delete, capacity eviction,
+    expiry and clear, so it never holds more keys than the cache itself.
+    """
+
+    def __init__(self, maxsize: int, ttl: int) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.tenant_keys: dict[str, set[str]] = {}
+
+    def __setitem__(self, cache_key: tuple[str, str], value: dict[str, Any]) -> None:
+        super().__setitem__(cache_key, value)
+        tenant_id, key = cache_key
+        self.tenant_keys.setdefault(tenant_id, set()).add(key)
+
+    def __delitem__(self, cache_key: tuple[str, str]) -> None:
+        super().__delitem__(cache_key)
+        self._unindex(cache_key)
+
+    def expire(self, time: float | None = None) -> list[tuple[Any, Any]]:
+        # TTLCache.expire removes entries without going through __delitem__
+        expired: list[tuple[Any, Any]] = super().expire(time)
+        for cache_key, _ in expired:
+            self._unindex(cache_key)
+        return expired
+
+    def clear(self) -> None:
+        # TTLCache.clear drops its storage directly, bypassing __delitem__
+        super().clear()
+        self.tenant_keys.clear()
+
+    def _unindex(self, cache_key: tuple[str, str]) -> None:
+        tenant_id, key = cache_key
+        keys = self.tenant_keys.get(tenant_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.tenant_keys[tenant_id]
+
+
 class HybridConfigCache:
     """Two-level configuration cache.
 
@@ -22,13 +68,23 @@ class HybridConfigCache:
 
     Event-driven invalidation on config update events.
 
+    The cache is intentionally lock-free. It is owned by a single event
+    loop, and every L1 read or write completes without an ``await`` in
+    between, so no coroutine can observe a half-applied update. Entries
+    are independent, which leaves nothing for a lock to protect; a
+    concurrent L2 read racing a write simply repopulates L1 with the
+    value Redis returned. Concurrent L1 misses for the same key share a
+    single in-flight L2 read rather than each issuing their own GET.
+
     Args:
-        l1_maxsize: Maximum L1 cache entries (default: 10,000).
+        l1_maxsize: Maximum L1 cache entries across all tenants (default: 10,000).
         l1_ttl: L1 TTL in seconds (default: 300 = 5 minutes).
         l2_ttl: L2 TTL in seconds (default: 3600 = 1 hour).
         redis_client: Optional async Redis client. If None, L2 is disabled.
     """
 
+    __slots__ = ("_inflight", "_l1", "_l2_ttl", "_redis")
+
     def __init__(
         self,
         l1_maxsize: int = 10_000,
@@ -36,18 +92,28 @@ class HybridConfigCache:
         l2_ttl: int = 3600,
         redis_client: Any | None = None,
     ) -> None:
-        self._l1: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=l1_maxsize, ttl=l1_ttl)
+        self._l1 = _TenantIndexedTTLCache(maxsize=l1_maxsize, ttl=l1_ttl)
         self._l2_ttl = l2_ttl
         self._redis = redis_client
+        self._inflight: dict[str, asyncio.Task[dict[str, Any] | None]] = {}
 
     def _cache_key(self, tenant_id: str, key: str) -> str:
-        """Build cache key with tenant isolation prefix."""
+        """Build L2 cache key with tenant isolation prefix."""
         return f"tenant:{tenant_id}:config:{key}"
 
+    def _promote_l1(self, tenant_id: str, key: str, value: dict[str, Any]) -> None:
+        """Copy an L2 hit into L1.
+
+        Runs synchronously: a dict write is cheaper than scheduling a task
+        for it, and later readers see the entry without another L2 round trip.
+        """
+        self._l1[(tenant_id, key)] = value
+
     async def get(self, tenant_id: str, key: str) -> dict[str, Any] | None:
         """Get from L1, fallback to L2, return None on miss.
 
-        On L2 hit, promotes value to L1.
+        On L2 hit, promotes value to L1. Concurrent callers missing L1
+        for the same key await a single shared L2 read.
 
         Args:
             tenant_id: Tenant slug.
@@ -56,24 +122,87 @@ class HybridConfigCache:
         Returns:
             Config value dict or None on miss.
         """
-        cache_key = self._cache_key(tenant_id, key)
-
         # L1 lookup
-        l1_value: dict[str, Any] | None = self._l1.get(cache_key)
+        l1_value: dict[str, Any] | None = self._l1.get((tenant_id, key))
         if l1_value is not None:
             return l1_value
 
         # L2 lookup
         if self._redis is not None:
-            raw = await self._redis.get(cache_key)
-            if raw is not None:
-                l2_value: dict[str, Any] = json.loads(raw)
-                # Promote to L1
-                self._l1[cache_key] = l2_value
-                return l2_value
+            return await self._get_l2(tenant_id, key)
 
         return None
 
+    async def _get_l2(self, tenant_id: str, key: str) -> dict[str, Any] | None:
+        """Read from L2, coalescing concurrent reads of the same key.
+
+        The first caller starts the Redis GET as a task; callers arriving
+        while it is in flight await the same task instead of querying
+        Redis again. Every caller awaits it through ``asyncio.shield``, so
+        cancelling one caller (e.g. a client disconnect) neither cancels
+        the read nor fails the other waiters.
+        """
+        cache_key = self._cache_key(tenant_id, key)
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_l2(tenant_id, key, cache_key))
+            self._inflight[cache_key] = task
+            task.add_done_callback(partial(self._finish_l2, cache_key))
+        return await asyncio.shield(task)
+
+    async def _fetch_l2(self, tenant_id: str, key: str, cache_key: str) -> dict[str, Any] | None:
+        """Issue the Redis GET for one key and promote a hit to L1."""
+        raw = await self._redis.get(cache_key)  # type: ignore[union-attr]
+        if raw is None:
+            return None
+        l2_value: dict[str, Any] = json.loads(raw)
+        self._promote_l1(tenant_id, key, l2_value)
+        return l2_value
+
+    def _finish_l2(self, cache_key: str, task: asyncio.Task[dict[str, Any] | None]) -> None:
+        """Drop a completed L2 read from the in-flight map."""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        if not task.cancelled():
+            # Mark retrieved so a failure nobody awaited does not log a warning
+            task.exception()
+
+    async def multi_get(self, tenant_id: str, keys: list[str]) -> dict[str, dict[str, Any]]:
+        """Get several keys for one tenant in a single pass.
+
+        Keys are served from L1 where possible; the remaining misses are
+        fetched from L2 with one ``MGET`` and promoted to L1.
+
+        Args:
+            tenant_id: Tenant slug.
+            keys: Configuration key strings.
+
+        Returns:
+            Mapping of key to config value dict. Keys missing from both
+            levels are omitted.
+        """
+        found: dict[str, dict[str, Any]] = {}
+        misses: list[str] = []
+
+        # L1 lookup
+        for key in keys:
+            l1_value: dict[str, Any] | None = self._l1.get((tenant_id, key))
+            if l1_value is not None:
+                found[key] = l1_value
+            else:
+                misses.append(key)
+
+        # L2 lookup
+        if misses and self._redis is not None:
+            raws = await self._redis.mget(*[self._cache_key(tenant_id, key) for key in misses])
+            for key, raw in zip(misses, raws, strict=True):
+                if raw is not None:
+                    l2_value: dict[str, Any] = json.loads(raw)
+                    self._promote_l1(tenant_id, key, l2_value)
+                    found[key] = l2_value
+
+        return found
+
     async def set(self, tenant_id: str, key: str, value: dict[str, Any]) -> None:
         """Write to both L1 and L2.
 
@@ -82,19 +211,40 @@ class HybridConfigCache:
             key: Configuration key string.
             value: Config value dict.
         """
-        cache_key = self._cache_key(tenant_id, key)
-
         # L1
-        self._l1[cache_key] = value
+        self._l1[(tenant_id, key)] = value
 
         # L2
         if self._redis is not None:
             await self._redis.set(
-                cache_key,
+                self._cache_key(tenant_id, key),
                 json.dumps(value),
                 ex=self._l2_ttl,
             )
 
+    async def multi_set(self, tenant_id: str, values: dict[str, dict[str, Any]]) -> None:
+        """Write several keys for one tenant to both L1 and L2.
+
+        L2 writes are sent in a single pipelined round trip.
+
+        Args:
+            tenant_id: Tenant slug.
+            values: Mapping of configuration key to config value dict.
+        """
+        if not values:
+            return
+
+        # L1
+        for key, value in values.items():
+            self._l1[(tenant_id, key)] = value
+
+        # L2
+        if self._redis is not None:
+            pipe = self._redis.pipeline(transaction=False)
+            for key, value in values.items():
+                pipe.set(self._cache_key(tenant_id, key), json.dumps(value), ex=self._l2_ttl)
+            await pipe.execute()
+
     async def invalidate(self, tenant_id: str, key: str) -> None:
         """Remove from both L1 and L2.
 
@@ -102,19 +252,17 @@ class HybridConfigCache:
             tenant_id: Tenant slug.
             key: Configuration key string.
         """
-        cache_key = self._cache_key(tenant_id, key)
-
         # L1
-        self._l1.pop(cache_key, None)
+        self._l1.pop((tenant_id, key), None)
 
         # L2
         if self._redis is not None:
-            await self._redis.delete(cache_key)
+            await self._redis.delete(self._cache_key(tenant_id, key))
 
     async def invalidate_tenant(self, tenant_id: str) -> None:
         """Remove all entries for a tenant (bulk invalidation).
 
-        L1: Iterate and remove matching keys.
+        L1: Remove the tenant's indexed keys.
         L2: Use Redis SCAN + DEL pattern.
 
         Args:
@@ -122,10 +270,9 @@ class HybridConfigCache:
         """
         prefix = f"tenant:{tenant_id}:config:"
 
-        # L1: Remove matching keys
-        keys_to_remove = [k for k in self._l1 if k.startswith(prefix)]
-        for k in keys_to_remove:
-            self._l1.pop(k, None)
+        # L1: Remove only this tenant's entries via the per-tenant index
+        for key in tuple(self._l1.tenant_keys.get(tenant_id, ())):
+            self._l1.pop((tenant_id, key), None)
 
         # L2: Scan and delete
         if self._redis is not None:
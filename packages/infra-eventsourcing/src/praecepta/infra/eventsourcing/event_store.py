@@ -39,10 +39,9 @@ Example:
 from __future__ import annotations
 
 import os
-from functools import lru_cache
+import threading
 from typing import TYPE_CHECKING, Any
 
-from eventsourcing.postgres import Factory as PostgresInfrastructureFactory
 from eventsourcing.utils import Environment
 from praecepta.infra.eventsourcing.postgres_parser import (
     parse_database_url,
@@ -51,7 +50,10 @@ from praecepta.infra.eventsourcing.postgres_parser import (
 from praecepta.infra.eventsourcing.settings import EventSourcingSettings
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from eventsourcing.persistence import ApplicationRecorder
+    from eventsourcing.postgres import Factory as PostgresInfrastructureFactory
 
 
 class EventStoreFactory:
@@ -96,12 +98,17 @@ class EventStoreFactory:
         self._infrastructure_factory: PostgresInfrastructureFactory | None = None
 
     @classmethod
-    def from_env(cls) -> EventStoreFactory:
+    def from_env(cls, env: Mapping[str, str] | None = None) -> EventStoreFactory:
         """Create factory from environment variables.
 
         Attempts to parse DATABASE_URL if present, otherwise falls back to
         individual POSTGRES_* variables.
 
+        Args:
+            env: Mapping to read instead of ``os.environ`` (e.g. a plain
+                ``dict`` in tests). When given, it is the only source;
+                ``os.environ`` and the ``.env`` file are ignored.
+
         Returns:
             Configured EventStoreFactory instance.
 
@@ -116,8 +123,10 @@ class EventStoreFactory:
             >>> os.environ['POSTGRES_PASSWORD'] = 'pass'
             >>> factory = EventStoreFactory.from_env()
         """
+        environ: Mapping[str, str] = os.environ if env is None else env
+
         # Check if DATABASE_URL is present
-        database_url = os.getenv("DATABASE_URL")
+        database_url = environ.get("DATABASE_URL")
 
         if database_url:
             # Parse DATABASE_URL and merge with any explicit POSTGRES_* overrides
@@ -126,17 +135,24 @@ class EventStoreFactory:
             if parsed:
                 # Create settings with DATABASE_URL values as defaults,
                 # but allow explicit POSTGRES_* env vars to override
+                if env is not None:
+                    merged = {key.upper(): str(value) for key, value in parsed.items()}
+                    merged.update(env)
+                    return cls(EventSourcingSettings.from_mapping(merged))
                 settings = EventSourcingSettings(
-                    postgres_dbname=os.getenv("POSTGRES_DBNAME", parsed["postgres_dbname"]),
-                    postgres_host=os.getenv("POSTGRES_HOST", parsed["postgres_host"]),
-                    postgres_port=int(os.getenv("POSTGRES_PORT", str(parsed["postgres_port"]))),
-                    postgres_user=os.getenv("POSTGRES_USER", parsed["postgres_user"]),
-                    postgres_password=os.getenv("POSTGRES_PASSWORD", parsed["postgres_password"]),
+                    postgres_dbname=environ.get("POSTGRES_DBNAME", parsed["postgres_dbname"]),
+                    postgres_host=environ.get("POSTGRES_HOST", parsed["postgres_host"]),
+                    postgres_port=int(environ.get("POSTGRES_PORT", str(parsed["postgres_port"]))),
+                    postgres_user=environ.get("POSTGRES_USER", parsed["postgres_user"]),
+                    postgres_password=environ.get("POSTGRES_PASSWORD", parsed["postgres_password"]),
                 )
                 return cls(settings)
 
         # Fall back to individual POSTGRES_* variables
-        settings = EventSourcingSettings()  # type: ignore[call-arg]
+        if env is None:
+            settings = EventSourcingSettings()  # type: ignore[call-arg]
+        else:
+            settings = EventSourcingSettings.from_mapping(env)
         return cls(settings)
 
     @classmethod
@@ -193,9 +209,15 @@ class EventStoreFactory:
     def _create_infrastructure_factory(self) -> PostgresInfrastructureFactory:
         """Create eventsourcing InfrastructureFactory from settings.
 
+        ``eventsourcing.postgres`` (and with it ``psycopg``) is imported
+        here rather than at module load, so importing this package stays
+        cheap for processes that never open the event store.
+
         Returns:
             Configured PostgresInfrastructureFactory instance.
         """
+        from eventsourcing.postgres import Factory as PostgresInfrastructureFactory
+
         env_dict = self._settings.to_env_dict()
 
         # Wrap env dict in Environment object for Factory.construct()
@@ -218,8 +240,11 @@ class EventStoreFactory:
             self._infrastructure_factory = None
 
 
-# Global singleton factory (cached)
-@lru_cache(maxsize=1)
+# Global singleton factory, created on first use
+_event_store: EventStoreFactory | None = None
+_event_store_lock = threading.Lock()
+
+
 def get_event_store() -> EventStoreFactory:
     """Get cached event store factory instance for direct access.
 
@@ -232,7 +257,9 @@ def get_event_store() -> EventStoreFactory:
     rebuilds, admin queries, or event stream inspection.
 
     The factory is lazy — no database connection is created until
-    ``.recorder`` is first accessed.
+    ``.recorder`` is first accessed. Creation is guarded by a lock so
+    concurrent first calls share one instance; later calls return it
+    without locking.
 
     Returns:
         Singleton EventStoreFactory instance.
@@ -242,4 +269,19 @@ def get_event_store() -> EventStoreFactory:
         >>> factory = get_event_store()
         >>> recorder = factory.recorder
     """
-    return EventStoreFactory.from_env()
+    global _event_store
+    store = _event_store
+    if store is not None:
+        return store
+
+    with _event_store_lock:
+        if _event_store is None:
+            _event_store = EventStoreFactory.from_env()
+        return _event_store
+
+
+def _reset_event_store() -> None:
+    """Drop the singleton so the next ``get_event_store()`` rebuilds it (for tests)."""
+    global _event_store
+    with _event_store_lock:
+        _event_store = None
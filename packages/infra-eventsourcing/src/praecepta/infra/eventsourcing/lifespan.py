@@ -18,7 +18,7 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, MutableMapping
 
 from praecepta.foundation.application import LifespanContribution
 
@@ -26,21 +26,20 @@ logger = logging.getLogger(__name__)
 
 # Keys bridged from EventSourcingSettings to os.environ.
 # Only set when not already present (explicit env vars always win).
-_BRIDGE_KEYS = frozenset(
-    {
-        "PERSISTENCE_MODULE",
-        "POSTGRES_DBNAME",
-        "POSTGRES_HOST",
-        "POSTGRES_PORT",
-        "POSTGRES_USER",
-        "POSTGRES_PASSWORD",
-        "CREATE_TABLE",
-        "POSTGRES_SCHEMA",
-    }
+# A tuple so bridging (and its debug logging) happens in a fixed order.
+_BRIDGE_KEYS: tuple[str, ...] = (
+    "PERSISTENCE_MODULE",
+    "POSTGRES_DBNAME",
+    "POSTGRES_HOST",
+    "POSTGRES_PORT",
+    "POSTGRES_USER",
+    "POSTGRES_PASSWORD",
+    "CREATE_TABLE",
+    "POSTGRES_SCHEMA",
 )
 
 
-def _bridge_settings_to_environ() -> None:
+def _bridge_settings_to_environ(environ: MutableMapping[str, str] | None = None) -> None:
     """Populate ``os.environ`` with ``EventSourcingSettings`` defaults.
 
     Only sets keys that are **not** already present in ``os.environ``,
@@ -48,8 +47,21 @@ def _bridge_settings_to_environ() -> None:
 
     Emits a warning if ``PERSISTENCE_MODULE`` was not set, since the
     eventsourcing library defaults to in-memory storage without it.
+
+    When every bridged key is already set, settings are not loaded at all.
+
+    Args:
+        environ: Mapping to read from and bridge into instead of
+            ``os.environ`` (e.g. a plain ``dict`` in tests).
     """
-    if "PERSISTENCE_MODULE" not in os.environ:
+    if environ is None:
+        environ = os.environ
+
+    missing = [key for key in _BRIDGE_KEYS if key not in environ]
+    if not missing:
+        return
+
+    if "PERSISTENCE_MODULE" not in environ:
         logger.warning(
             "PERSISTENCE_MODULE not set in environment. "
             "Bridging from EventSourcingSettings (default: eventsourcing.postgres). "
@@ -59,7 +71,10 @@ def _bridge_settings_to_environ() -> None:
     try:
         from praecepta.infra.eventsourcing.settings import EventSourcingSettings
 
-        settings = EventSourcingSettings()  # type: ignore[call-arg]
+        if environ is os.environ:
+            settings = EventSourcingSettings()  # type: ignore[call-arg]
+        else:
+            settings = EventSourcingSettings.from_mapping(environ)
     except Exception:
         logger.warning(
             "Could not load EventSourcingSettings for environment bridging. "
@@ -68,9 +83,9 @@ def _bridge_settings_to_environ() -> None:
         return
 
     env_dict = settings.to_env_dict()
-    for key in _BRIDGE_KEYS:
-        if key not in os.environ and key in env_dict:
-            os.environ[key] = env_dict[key]
+    for key in missing:
+        if key in env_dict:
+            environ[key] = env_dict[key]
             log_value = "***" if "PASSWORD" in key else env_dict[key]
             logger.debug("Bridged %s=%s to os.environ", key, log_value)
 
@@ -7,11 +7,13 @@ projections that consume domain events and maintain read models.
 from praecepta.infra.eventsourcing.projections.base import BaseProjection
 from praecepta.infra.eventsourcing.projections.rebuilder import ProjectionRebuilder
 from praecepta.infra.eventsourcing.projections.subscription_runner import (
+    RunnerState,
     SubscriptionProjectionRunner,
 )
 
 __all__ = [
     "BaseProjection",
     "ProjectionRebuilder",
+    "RunnerState",
     "SubscriptionProjectionRunner",
 ]
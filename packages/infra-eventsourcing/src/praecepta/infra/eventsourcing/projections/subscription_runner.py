@@ -39,7 +39,9 @@ See Also:
 from __future__ import annotations
 
 import logging
-from threading import Event, Thread
+from contextlib import ExitStack
+from enum import StrEnum
+from threading import Event, Lock, Thread
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -51,6 +53,20 @@ logger = logging.getLogger(__name__)
 _HEALTH_CHECK_INTERVAL_SECONDS = 2.0
 
 
+class RunnerState(StrEnum):
+    """Lifecycle states of a ``SubscriptionProjectionRunner``.
+
+    IDLE -> STARTING -> RUNNING -> STOPPING -> IDLE
+
+    A failed start returns to IDLE after stopping any runners it entered.
+    """
+
+    IDLE = "IDLE"
+    STARTING = "STARTING"
+    RUNNING = "RUNNING"
+    STOPPING = "STOPPING"
+
+
 class SubscriptionProjectionRunner:
     """Manages one ``ProjectionRunner`` per projection.
 
@@ -65,9 +81,23 @@ class SubscriptionProjectionRunner:
         _upstream_application: Application class that produces events.
         _env: Optional environment variables for eventsourcing config.
         _runners: Active ``ProjectionRunner`` instances.
-        _started: Whether the runner group is currently active.
+        state: Current lifecycle state (see ``RunnerState``).
+        is_running: Whether the runner group is currently active.
     """
 
+    __slots__ = (
+        "_env",
+        "_monitor_thread",
+        "_projections",
+        "_runners",
+        "_stack",
+        "_state_lock",
+        "_stop_monitor",
+        "_upstream_application",
+        "is_running",
+        "state",
+    )
+
     def __init__(
         self,
         projections: list[type[BaseProjection]],
@@ -88,7 +118,10 @@ class SubscriptionProjectionRunner:
         self._upstream_application = upstream_application
         self._env = env
         self._runners: list[ProjectionRunner[Any, Any]] = []
-        self._started = False
+        self._stack = ExitStack()
+        self.state = RunnerState.IDLE
+        self.is_running = False
+        self._state_lock = Lock()
         self._stop_monitor = Event()
         self._monitor_thread: Thread | None = None
 
@@ -101,24 +134,54 @@ class SubscriptionProjectionRunner:
         ``PostgresTrackingRecorder`` view — no per-projection event
         store or ``ProcessRecorder`` is created.
 
+        If any runner fails to start, the runners already entered are
+        stopped and the group returns to ``RunnerState.IDLE``.
+
         Raises:
-            RuntimeError: If the runner group is already started.
+            RuntimeError: If the runner group is already started, or is
+                still stopping.
         """
-        if self._started:
-            msg = "SubscriptionProjectionRunner already started"
-            raise RuntimeError(msg)
+        with self._state_lock:
+            if self.state is RunnerState.STOPPING:
+                msg = "SubscriptionProjectionRunner is still stopping"
+                raise RuntimeError(msg)
+            if self.state is not RunnerState.IDLE:
+                msg = "SubscriptionProjectionRunner already started"
+                raise RuntimeError(msg)
+            self.state = RunnerState.STARTING
+
+        try:
+            self._start_runners()
+        except BaseException:
+            logger.warning(
+                "Failed to start subscription runners for %s; stopping %d started runner(s)",
+                self._upstream_application.__name__,
+                len(self._runners),
+            )
+            self._stop_runners()
+            self._set_state(RunnerState.IDLE)
+            raise
+
+        self._set_state(RunnerState.RUNNING)
+        logger.info("Subscription runners started")
 
-        logger.info(
-            "Starting subscription runners for %s with %d projection(s)",
-            self._upstream_application.__name__,
-            len(self._projections),
-        )
+    def _start_runners(self) -> None:
+        """Enter one ``ProjectionRunner`` per projection and start the monitor."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Starting subscription runners for %s with %d projection(s): %s",
+                self._upstream_application.__name__,
+                len(self._projections),
+                ", ".join(
+                    f"{proj_cls.__name__} (topics: {proj_cls.topics or 'all'})"
+                    for proj_cls in self._projections
+                ),
+            )
 
         from eventsourcing.postgres import PostgresTrackingRecorder
         from eventsourcing.projection import ProjectionRunner as _ProjectionRunner
 
         for proj_cls in self._projections:
-            logger.info("  - %s (topics: %s)", proj_cls.__name__, proj_cls.topics or "all")
             runner: _ProjectionRunner[Any, Any] = _ProjectionRunner(
                 application_class=self._upstream_application,
                 projection_class=proj_cls,
@@ -128,6 +191,7 @@ class SubscriptionProjectionRunner:
             # __enter__ activates the subscription and starts processing
             runner.__enter__()
             self._runners.append(runner)
+            self._stack.callback(self._exit_runner, runner)
 
         # Start health monitor to detect processing thread failures
         if self._runners:
@@ -139,39 +203,61 @@ class SubscriptionProjectionRunner:
             )
             self._monitor_thread.start()
 
-        self._started = True
-        logger.info("Subscription runners started")
-
     def stop(self) -> None:
         """Stop all subscription runners and release resources.
 
-        Safe to call even if not started (logs a warning).
-        Runners are stopped in reverse order of creation.
+        Safe to call even if not started (logs a warning), or while
+        another thread is already stopping the group. Runners are
+        stopped in reverse order of creation.
+
+        Raises:
+            RuntimeError: If the runner group is still starting.
         """
-        if not self._started:
-            logger.warning("SubscriptionProjectionRunner not started, nothing to stop")
-            return
+        with self._state_lock:
+            if self.state is RunnerState.IDLE:
+                logger.warning("SubscriptionProjectionRunner not started, nothing to stop")
+                return
+            if self.state is RunnerState.STOPPING:
+                return
+            if self.state is RunnerState.STARTING:
+                msg = "SubscriptionProjectionRunner is still starting"
+                raise RuntimeError(msg)
+            self.state = RunnerState.STOPPING
+            self.is_running = False
 
         logger.info("Stopping subscription runners...")
+        self._stop_runners()
+        self._set_state(RunnerState.IDLE)
+        logger.info("Subscription runners stopped")
 
+    def _stop_runners(self) -> None:
+        """Stop the health monitor, then exit runners in reverse order."""
         # Stop health monitor before runners to avoid false positives
         self._stop_monitor.set()
         if self._monitor_thread is not None:
             self._monitor_thread.join(timeout=5.0)
             self._monitor_thread = None
 
-        for runner in reversed(self._runners):
-            try:
-                runner.__exit__(None, None, None)
-            except Exception:
-                logger.exception(
-                    "Error stopping runner for %s",
-                    type(runner.projection).__name__,
-                )
-
+        # Callbacks run in LIFO order, i.e. reverse order of creation
+        self._stack.close()
         self._runners.clear()
-        self._started = False
-        logger.info("Subscription runners stopped")
+
+    @staticmethod
+    def _exit_runner(runner: ProjectionRunner[Any, Any]) -> None:
+        """Exit one runner, logging rather than raising on failure."""
+        try:
+            runner.__exit__(None, None, None)
+        except Exception:
+            logger.exception(
+                "Error stopping runner for %s",
+                type(runner.projection).__name__,
+            )
+
+    def _set_state(self, target: RunnerState) -> None:
+        """Set the lifecycle state under the state lock."""
+        with self._state_lock:
+            self.state = target
+            self.is_running = target is RunnerState.RUNNING
 
     def _monitor_health(self) -> None:
         """Watch for processing thread failures and log immediately.
@@ -208,11 +294,6 @@ class SubscriptionProjectionRunner:
                 break
             self._stop_monitor.wait(timeout=_HEALTH_CHECK_INTERVAL_SECONDS)
 
-    @property
-    def is_running(self) -> bool:
-        """Check if the runner group is currently active."""
-        return self._started
-
     def __enter__(self) -> SubscriptionProjectionRunner:
         """Context manager entry: start the runner group."""
         self.start()
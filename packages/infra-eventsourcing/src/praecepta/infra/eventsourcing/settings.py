@@ -5,13 +5,13 @@ with PostgreSQL backend. Settings are loaded from environment variables
 and validated using Pydantic.
 """
 
-from __future__ import annotations
-
 import os
 import warnings
+from collections.abc import Mapping
+from typing import ClassVar
 
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
 
 
 class EventSourcingSettings(BaseSettings):
@@ -65,6 +65,9 @@ class EventSourcingSettings(BaseSettings):
         extra="ignore",
     )
 
+    # Read once at import; see refresh_environment()
+    _is_production: ClassVar[bool] = os.getenv("ENVIRONMENT", "development") == "production"
+
     # Persistence backend
     persistence_module: str = "eventsourcing.postgres"
 
@@ -175,10 +178,11 @@ class EventSourcingSettings(BaseSettings):
 
         In production, tables should be created via migrations
         for better control and versioning.
-        """
-        environment = os.getenv("ENVIRONMENT", "development")
 
-        if environment == "production" and v:
+        ``ENVIRONMENT`` is read once at import time rather than on every
+        validation; call :meth:`refresh_environment` after changing it.
+        """
+        if cls._is_production and v:
             warnings.warn(
                 "CREATE_TABLE=true in production environment. Consider using migrations instead.",
                 UserWarning,
@@ -187,9 +191,43 @@ class EventSourcingSettings(BaseSettings):
 
         return v
 
+    @classmethod
+    def refresh_environment(cls) -> None:
+        """Re-read ``ENVIRONMENT`` from ``os.environ``.
+
+        Only needed when ``ENVIRONMENT`` changes after this module was
+        imported (e.g. in tests).
+        """
+        cls._is_production = os.getenv("ENVIRONMENT", "development") == "production"
+
+    @classmethod
+    def from_mapping(cls, env: Mapping[str, str]) -> "EventSourcingSettings":
+        """Create settings from an explicit environment mapping.
+
+        Keys are upper-case environment variable names, as in ``os.environ``.
+        ``env`` is the only source: ``os.environ`` and the ``.env`` file are
+        not read, so fields it omits take their defaults.
+
+        Args:
+            env: Environment variable mapping (e.g. a plain ``dict``).
+
+        Returns:
+            Validated EventSourcingSettings instance.
+
+        Raises:
+            pydantic.ValidationError: If required values are missing or invalid.
+        """
+        values = {
+            name: env[name.upper()] for name in _MappingSettings.model_fields if name.upper() in env
+        }
+        return _MappingSettings(**values)  # type: ignore[arg-type]
+
     def to_env_dict(self) -> dict[str, str]:
         """Convert settings to environment variable dictionary.
 
+        Each call builds a new dictionary from the current field values,
+        so callers may modify it freely.
+
         Returns:
             Dictionary with uppercase keys suitable for
             InfrastructureFactory.construct(env).
@@ -224,3 +262,19 @@ class EventSourcingSettings(BaseSettings):
             "POSTGRES_PRE_PING": "y" if self.postgres_pre_ping else "",
             "POSTGRES_SINGLE_ROW_TRACKING": "y" if self.postgres_single_row_tracking else "",
         }
+
+
+class _MappingSettings(EventSourcingSettings):
+    """EventSourcingSettings built by from_mapping() from init values only."""
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Skip ``os.environ``, the ``.env`` file and secrets."""
+        return (init_settings,)
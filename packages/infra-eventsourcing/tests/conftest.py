@@ -0,0 +1,48 @@
+"""Shared fixtures for infra-eventsourcing tests."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_REQUIRED_POSTGRES_VARS: dict[str, str] = {
+    "POSTGRES_DBNAME": "testdb",
+    "POSTGRES_USER": "testuser",
+    "POSTGRES_PASSWORD": "testpass",
+}
+
+
+def _pg_env_keys() -> list[str]:
+    return [
+        key
+        for key in os.environ
+        if key.startswith("POSTGRES_")
+        or key in ("DATABASE_URL", "PERSISTENCE_MODULE", "CREATE_TABLE")
+    ]
+
+
+@pytest.fixture()
+def no_pg_env(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Remove DATABASE_URL and every bridged variable from ``os.environ``.
+
+    Only the matching keys are touched, so the rest of the environment is
+    neither copied nor restored.
+    """
+    for key in _pg_env_keys():
+        monkeypatch.delenv(key)
+    yield
+    # monkeypatch only restores keys it removed; drop any the test added
+    for key in _pg_env_keys():
+        del os.environ[key]
+
+
+@pytest.fixture()
+def clean_pg_env(no_pg_env: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Set only the required POSTGRES_* variables in ``os.environ``."""
+    for key, value in _REQUIRED_POSTGRES_VARS.items():
+        monkeypatch.setenv(key, value)
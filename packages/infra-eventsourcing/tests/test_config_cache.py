@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -71,6 +72,54 @@ class TestHybridConfigCacheL1:
         # Other tenant should be unaffected
         assert await cache.get("tenant2", "key1") == {"value": "other"}
 
+    @pytest.mark.asyncio
+    async def test_l1_maxsize_caps_entries_across_tenants(self) -> None:
+        cache = HybridConfigCache(l1_maxsize=2)
+        await cache.set("tenant1", "key1", {"value": "1"})
+        await cache.set("tenant2", "key1", {"value": "2"})
+        await cache.set("tenant3", "key1", {"value": "3"})
+
+        assert len(cache._l1) == 2
+        assert await cache.get("tenant1", "key1") is None
+        assert await cache.get("tenant3", "key1") == {"value": "3"}
+        # Evicted entries leave the tenant index too
+        assert cache._l1.tenant_keys == {"tenant2": {"key1"}, "tenant3": {"key1"}}
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_leave_tenant_index(self) -> None:
+        cache = HybridConfigCache(l1_ttl=10)
+        await cache.set("tenant1", "key1", {"value": "1"})
+
+        expired = cache._l1.expire(cache._l1.timer() + 11)
+
+        assert [key for key, _ in expired] == [("tenant1", "key1")]
+        assert await cache.get("tenant1", "key1") is None
+        assert cache._l1.tenant_keys == {}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_keeps_tenant_index_in_sync(self) -> None:
+        cache = HybridConfigCache()
+        await cache.set("tenant1", "key1", {"value": "1"})
+        await cache.set("tenant1", "key2", {"value": "2"})
+
+        await cache.invalidate("tenant1", "key1")
+        assert cache._l1.tenant_keys == {"tenant1": {"key2"}}
+
+        await cache.invalidate_tenant("tenant1")
+        assert cache._l1.tenant_keys == {}
+        assert len(cache._l1) == 0
+
+    @pytest.mark.asyncio
+    async def test_clear_resets_tenant_index(self) -> None:
+        cache = HybridConfigCache()
+        await cache.set("tenant1", "key1", {"value": "1"})
+
+        cache._l1.clear()
+        assert cache._l1.tenant_keys == {}
+
+        await cache.set("tenant1", "key2", {"value": "2"})
+        assert cache._l1.tenant_keys == {"tenant1": {"key2"}}
+
     @pytest.mark.asyncio
     async def test_overwrite_existing_key(self) -> None:
         cache = HybridConfigCache()
@@ -80,6 +129,15 @@ class TestHybridConfigCacheL1:
         result = await cache.get("tenant1", "key1")
         assert result == {"value": "new"}
 
+    @pytest.mark.asyncio
+    async def test_multi_set_and_multi_get(self) -> None:
+        cache = HybridConfigCache()
+        await cache.multi_set("tenant1", {"key1": {"value": "1"}, "key2": {"value": "2"}})
+
+        result = await cache.multi_get("tenant1", ["key1", "key2", "missing"])
+
+        assert result == {"key1": {"value": "1"}, "key2": {"value": "2"}}
+
     def test_cache_key_format(self) -> None:
         cache = HybridConfigCache()
         key = cache._cache_key("my-tenant", "my-key")
@@ -128,6 +186,142 @@ class TestHybridConfigCacheL2:
         assert result2 == {"enabled": True}
         assert mock_redis.get.call_count == 1  # Only called once
 
+    @pytest.mark.asyncio
+    async def test_concurrent_l2_reads_are_coalesced(self) -> None:
+        release = asyncio.Event()
+
+        async def slow_get(cache_key: str) -> str:
+            await release.wait()
+            return '{"enabled": true}'
+
+        mock_redis = AsyncMock()
+        mock_redis.get.side_effect = slow_get
+        cache = HybridConfigCache(redis_client=mock_redis)
+
+        tasks = [asyncio.create_task(cache.get("tenant1", "key1")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == [{"enabled": True}] * 5
+        assert mock_redis.get.call_count == 1
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_l2_error_propagates_to_waiting_readers(self) -> None:
+        release = asyncio.Event()
+
+        async def failing_get(cache_key: str) -> str:
+            await release.wait()
+            raise ConnectionError("redis down")
+
+        mock_redis = AsyncMock()
+        mock_redis.get.side_effect = failing_get
+        cache = HybridConfigCache(redis_client=mock_redis)
+
+        tasks = [asyncio.create_task(cache.get("tenant1", "key1")) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert mock_redis.get.call_count == 1
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_fail_waiters(self) -> None:
+        release = asyncio.Event()
+
+        async def slow_get(cache_key: str) -> str:
+            await release.wait()
+            return '{"enabled": true}'
+
+        mock_redis = AsyncMock()
+        mock_redis.get.side_effect = slow_get
+        cache = HybridConfigCache(redis_client=mock_redis)
+
+        leader = asyncio.create_task(cache.get("tenant1", "key1"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get("tenant1", "key1"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await waiter == {"enabled": True}
+        assert leader.cancelled()
+        assert mock_redis.get.call_count == 1
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_l2_read_completes_when_every_caller_is_cancelled(self) -> None:
+        release = asyncio.Event()
+
+        async def slow_get(cache_key: str) -> str:
+            await release.wait()
+            return '{"enabled": true}'
+
+        mock_redis = AsyncMock()
+        mock_redis.get.side_effect = slow_get
+        cache = HybridConfigCache(redis_client=mock_redis)
+
+        caller = asyncio.create_task(cache.get("tenant1", "key1"))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        # The shielded read still promoted its result to L1
+        assert cache._inflight == {}
+        assert await cache.get("tenant1", "key1") == {"enabled": True}
+        assert mock_redis.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_multi_get_fetches_only_l1_misses_from_l2(self) -> None:
+        mock_redis = AsyncMock()
+        mock_redis.mget.return_value = ['{"value": "2"}', None]
+        cache = HybridConfigCache(redis_client=mock_redis)
+        cache._l1[("tenant1", "key1")] = {"value": "1"}
+
+        result = await cache.multi_get("tenant1", ["key1", "key2", "key3"])
+
+        assert result == {"key1": {"value": "1"}, "key2": {"value": "2"}}
+        mock_redis.mget.assert_called_once_with(
+            "tenant:tenant1:config:key2", "tenant:tenant1:config:key3"
+        )
+        # L2 hit promoted to L1
+        assert await cache.get("tenant1", "key2") == {"value": "2"}
+        mock_redis.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_multi_get_skips_l2_on_full_l1_hit(self) -> None:
+        mock_redis = AsyncMock()
+        cache = HybridConfigCache(redis_client=mock_redis)
+        cache._l1[("tenant1", "key1")] = {"value": "1"}
+
+        result = await cache.multi_get("tenant1", ["key1"])
+
+        assert result == {"key1": {"value": "1"}}
+        mock_redis.mget.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_multi_set_pipelines_l2_writes(self) -> None:
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock()
+        mock_redis = AsyncMock()
+        mock_redis.pipeline = MagicMock(return_value=mock_pipe)
+        cache = HybridConfigCache(redis_client=mock_redis)
+
+        await cache.multi_set("tenant1", {"key1": {"value": "1"}, "key2": {"value": "2"}})
+
+        assert mock_pipe.set.call_count == 2
+        assert mock_pipe.set.call_args_list[0][0][0] == "tenant:tenant1:config:key1"
+        mock_pipe.execute.assert_awaited_once()
+        mock_redis.set.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_invalidate_deletes_from_l2(self) -> None:
         mock_redis = AsyncMock()
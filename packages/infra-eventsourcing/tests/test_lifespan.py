@@ -10,6 +10,7 @@ import pytest
 
 from praecepta.foundation.application import LifespanContribution
 from praecepta.infra.eventsourcing.lifespan import (
+    _BRIDGE_KEYS,
     _bridge_settings_to_environ,
     lifespan_contribution,
 )
@@ -37,6 +38,7 @@ class TestLifespanContribution:
 
 
 @pytest.mark.unit
+@pytest.mark.usefixtures("no_pg_env")
 class TestBridgeSettingsToEnviron:
     """Tests for _bridge_settings_to_environ() function."""
 
@@ -48,13 +50,10 @@ class TestBridgeSettingsToEnviron:
 
     def test_bridges_persistence_module_when_absent(self) -> None:
         """PERSISTENCE_MODULE should be set from settings default."""
-        clean_env = {**self._REQUIRED_POSTGRES_VARS}
-        # Remove PERSISTENCE_MODULE if present
-        clean_env.pop("PERSISTENCE_MODULE", None)
+        env = {**self._REQUIRED_POSTGRES_VARS}
 
-        with patch.dict(os.environ, clean_env, clear=True):
-            _bridge_settings_to_environ()
-            assert os.environ["PERSISTENCE_MODULE"] == "eventsourcing.postgres"
+        _bridge_settings_to_environ(env)
+        assert env["PERSISTENCE_MODULE"] == "eventsourcing.postgres"
 
     def test_does_not_overwrite_existing_persistence_module(self) -> None:
         """Explicit env vars should take precedence over settings defaults."""
@@ -63,18 +62,15 @@ class TestBridgeSettingsToEnviron:
             "PERSISTENCE_MODULE": "eventsourcing.sqlite",
         }
 
-        with patch.dict(os.environ, env, clear=True):
-            _bridge_settings_to_environ()
-            assert os.environ["PERSISTENCE_MODULE"] == "eventsourcing.sqlite"
+        _bridge_settings_to_environ(env)
+        assert env["PERSISTENCE_MODULE"] == "eventsourcing.sqlite"
 
     def test_bridges_postgres_host_when_absent(self) -> None:
         """POSTGRES_HOST should be bridged from settings default."""
         env = {**self._REQUIRED_POSTGRES_VARS}
-        env.pop("POSTGRES_HOST", None)
 
-        with patch.dict(os.environ, env, clear=True):
-            _bridge_settings_to_environ()
-            assert os.environ["POSTGRES_HOST"] == "localhost"
+        _bridge_settings_to_environ(env)
+        assert env["POSTGRES_HOST"] == "localhost"
 
     def test_does_not_overwrite_existing_postgres_host(self) -> None:
         env = {
@@ -82,41 +78,53 @@ class TestBridgeSettingsToEnviron:
             "POSTGRES_HOST": "db.example.com",
         }
 
-        with patch.dict(os.environ, env, clear=True):
-            _bridge_settings_to_environ()
-            assert os.environ["POSTGRES_HOST"] == "db.example.com"
+        _bridge_settings_to_environ(env)
+        assert env["POSTGRES_HOST"] == "db.example.com"
 
     def test_bridges_multiple_keys(self) -> None:
         """All bridge keys should be populated when absent."""
         env = {**self._REQUIRED_POSTGRES_VARS}
 
-        with patch.dict(os.environ, env, clear=True):
-            _bridge_settings_to_environ()
+        _bridge_settings_to_environ(env)
 
-            assert os.environ["PERSISTENCE_MODULE"] == "eventsourcing.postgres"
-            assert os.environ["POSTGRES_HOST"] == "localhost"
-            assert os.environ["POSTGRES_PORT"] == "5432"
-            assert os.environ["POSTGRES_SCHEMA"] == "public"
-            assert os.environ["CREATE_TABLE"] == "true"
+        assert env["PERSISTENCE_MODULE"] == "eventsourcing.postgres"
+        assert env["POSTGRES_HOST"] == "localhost"
+        assert env["POSTGRES_PORT"] == "5432"
+        assert env["POSTGRES_SCHEMA"] == "public"
+        assert env["CREATE_TABLE"] == "true"
 
     def test_does_not_crash_when_settings_cannot_load(self) -> None:
         """Missing required fields -> bridge logs warning and returns."""
         # No POSTGRES_* vars at all
-        with patch.dict(os.environ, {}, clear=True):
-            # Should not raise
-            _bridge_settings_to_environ()
-            # PERSISTENCE_MODULE should NOT be set (settings failed to load)
-            assert "PERSISTENCE_MODULE" not in os.environ
+        env: dict[str, str] = {}
+
+        # Should not raise
+        _bridge_settings_to_environ(env)
+        # PERSISTENCE_MODULE should NOT be set (settings failed to load)
+        assert "PERSISTENCE_MODULE" not in env
+
+    def test_skips_settings_when_all_keys_present(self) -> None:
+        """Nothing to bridge -> settings are never constructed."""
+        env = dict.fromkeys(_BRIDGE_KEYS, "set")
+
+        with patch(
+            "praecepta.infra.eventsourcing.settings.EventSourcingSettings.from_mapping"
+        ) as mock_from_mapping:
+            _bridge_settings_to_environ(env)
+
+        mock_from_mapping.assert_not_called()
+        assert env == dict.fromkeys(_BRIDGE_KEYS, "set")
+
+    def test_bridges_into_os_environ_by_default(self, clean_pg_env: None) -> None:
+        _bridge_settings_to_environ()
+        assert os.environ["PERSISTENCE_MODULE"] == "eventsourcing.postgres"
 
     def test_logs_warning_when_persistence_module_absent(self) -> None:
         """A warning should be logged when PERSISTENCE_MODULE is missing."""
         env = {**self._REQUIRED_POSTGRES_VARS}
 
-        with (
-            patch.dict(os.environ, env, clear=True),
-            patch("praecepta.infra.eventsourcing.lifespan.logger") as mock_logger,
-        ):
-            _bridge_settings_to_environ()
+        with patch("praecepta.infra.eventsourcing.lifespan.logger") as mock_logger:
+            _bridge_settings_to_environ(env)
             mock_logger.warning.assert_any_call(
                 "PERSISTENCE_MODULE not set in environment. "
                 "Bridging from EventSourcingSettings (default: eventsourcing.postgres). "
@@ -130,11 +138,8 @@ class TestBridgeSettingsToEnviron:
             "PERSISTENCE_MODULE": "eventsourcing.postgres",
         }
 
-        with (
-            patch.dict(os.environ, env, clear=True),
-            patch("praecepta.infra.eventsourcing.lifespan.logger") as mock_logger,
-        ):
-            _bridge_settings_to_environ()
+        with patch("praecepta.infra.eventsourcing.lifespan.logger") as mock_logger:
+            _bridge_settings_to_environ(env)
             # The specific "not set" warning should NOT have been called
             for call_args in mock_logger.warning.call_args_list:
                 assert "PERSISTENCE_MODULE not set" not in str(call_args)
@@ -147,7 +152,7 @@ class TestBridgeSettingsToEnviron:
 
 @pytest.mark.unit
 class TestEventStoreLifespan:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_calls_bridge_and_initialises_store(self) -> None:
         """Lifespan should bridge settings, get store, yield, then close."""
         from praecepta.infra.eventsourcing.lifespan import event_store_lifespan
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 import pytest
 
@@ -35,10 +35,10 @@ class TestBaseProjectionContract:
             def clear_read_model(self) -> None:
                 pass
 
-        mock_view = MagicMock()
+        mock_view = Mock(spec=["insert_tracking"])
         proj = ConcreteProjection(view=mock_view)
-        mock_event = MagicMock()
-        mock_tracking = MagicMock()
+        mock_event = Mock(spec=[])
+        mock_tracking = Mock(spec=[])
 
         proj.process_event(mock_event, mock_tracking)
 
@@ -59,11 +59,11 @@ class TestProjectionRebuilder:
     """Tests for ProjectionRebuilder workflow."""
 
     def test_rebuild_calls_clear_read_model(self) -> None:
-        mock_projection = MagicMock()
+        mock_projection = Mock(spec=["clear_read_model", "name"])
         mock_projection.name = "TestProjection"
 
-        mock_app = MagicMock()
-        mock_app.recorder.delete_tracking_record = MagicMock()
+        mock_app = Mock(spec=["recorder"])
+        mock_app.recorder = Mock(spec=["delete_tracking_record"])
 
         rebuilder = ProjectionRebuilder(upstream_app=mock_app)
         rebuilder.rebuild(mock_projection)
@@ -71,10 +71,11 @@ class TestProjectionRebuilder:
         mock_projection.clear_read_model.assert_called_once()
 
     def test_rebuild_resets_tracking_position(self) -> None:
-        mock_projection = MagicMock()
+        mock_projection = Mock(spec=["clear_read_model", "name"])
         mock_projection.name = "TestProjection"
 
-        mock_app = MagicMock()
+        mock_app = Mock(spec=["recorder"])
+        mock_app.recorder = Mock(spec=["delete_tracking_record"])
         rebuilder = ProjectionRebuilder(upstream_app=mock_app)
         rebuilder.rebuild(mock_projection)
 
@@ -82,11 +83,11 @@ class TestProjectionRebuilder:
 
     def test_rebuild_handles_missing_delete_tracking(self) -> None:
         """Rebuilder should warn if recorder doesn't support delete_tracking_record."""
-        mock_projection = MagicMock()
+        mock_projection = Mock(spec=["clear_read_model", "name"])
         mock_projection.name = "TestProjection"
 
-        mock_recorder = MagicMock(spec=[])  # No methods on recorder
-        mock_app = MagicMock()
+        mock_recorder = Mock(spec=[])  # No methods on recorder
+        mock_app = Mock(spec=["recorder"])
         mock_app.recorder = mock_recorder
 
         rebuilder = ProjectionRebuilder(upstream_app=mock_app)
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import Any, ClassVar
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 
 import pytest
 
@@ -17,6 +18,9 @@ from praecepta.infra.eventsourcing.projection_lifespan import (
     projection_runner_lifespan,
 )
 from praecepta.infra.eventsourcing.projections.base import BaseProjection
+from praecepta.infra.eventsourcing.projections.subscription_runner import (
+    SubscriptionProjectionRunner,
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -48,6 +52,15 @@ class _StubProjection(BaseProjection):
         pass
 
 
+class _SecondStubProjection(BaseProjection):
+    """Second projection sharing _StubApplication as its upstream."""
+
+    upstream_application: ClassVar[type[Any]] = _StubApplication  # type: ignore[assignment]
+
+    def clear_read_model(self) -> None:
+        pass
+
+
 class _AnotherProjection(BaseProjection):
     """Another concrete BaseProjection subclass for testing (with upstream)."""
 
@@ -64,6 +77,16 @@ class _OrphanProjection(BaseProjection):
         pass
 
 
+# Discovered contributions shared across tests (DiscoveredContribution is immutable)
+_C_STUB = _make_contrib("p1", GROUP_PROJECTIONS, _StubProjection)
+_C_ANOTHER = _make_contrib("p2", GROUP_PROJECTIONS, _AnotherProjection)
+_C_NOT_A_CLASS = _make_contrib("bad", GROUP_PROJECTIONS, "not_a_class")
+_C_WRONG_BASE = _make_contrib("wrong", GROUP_PROJECTIONS, _StubApplication)
+
+# Opaque app argument; the lifespan never inspects it
+_APP: Any = object()
+
+
 def _mock_settings() -> MagicMock:
     """Create a mock EventSourcingSettings for tests."""
     settings = MagicMock()
@@ -103,46 +126,32 @@ class TestProjectionLifespanContribution:
 
 @pytest.mark.unit
 class TestDiscoverProjections:
+    @pytest.mark.parametrize(
+        ("contribs", "expected"),
+        [
+            pytest.param([_C_STUB], [_StubProjection], id="base_projection_subclass"),
+            pytest.param([_C_NOT_A_CLASS], [], id="filters_non_class_value"),
+            pytest.param([_C_WRONG_BASE], [], id="filters_wrong_base_class"),
+            pytest.param([], [], id="empty_entry_points"),
+            pytest.param(
+                [_C_STUB, _C_ANOTHER],
+                [_StubProjection, _AnotherProjection],
+                id="multiple_projections",
+            ),
+        ],
+    )
     @patch("praecepta.infra.eventsourcing.projection_lifespan.discover")
-    def test_returns_base_projection_subclasses(self, mock_discover: MagicMock) -> None:
-        mock_discover.return_value = [
-            _make_contrib("p1", GROUP_PROJECTIONS, _StubProjection),
-        ]
+    def test_discover_projections(
+        self,
+        mock_discover: MagicMock,
+        contribs: list[DiscoveredContribution],
+        expected: list[type[BaseProjection]],
+    ) -> None:
+        mock_discover.return_value = contribs
         result = _discover_projections()
-        assert result == [_StubProjection]
+        assert result == expected
         mock_discover.assert_called_once_with(GROUP_PROJECTIONS)
 
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.discover")
-    def test_filters_non_class_value(self, mock_discover: MagicMock) -> None:
-        mock_discover.return_value = [
-            _make_contrib("bad", GROUP_PROJECTIONS, "not_a_class"),
-        ]
-        result = _discover_projections()
-        assert result == []
-
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.discover")
-    def test_filters_wrong_base_class(self, mock_discover: MagicMock) -> None:
-        mock_discover.return_value = [
-            _make_contrib("wrong", GROUP_PROJECTIONS, _StubApplication),
-        ]
-        result = _discover_projections()
-        assert result == []
-
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.discover")
-    def test_empty_entry_points(self, mock_discover: MagicMock) -> None:
-        mock_discover.return_value = []
-        result = _discover_projections()
-        assert result == []
-
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.discover")
-    def test_multiple_projections(self, mock_discover: MagicMock) -> None:
-        mock_discover.return_value = [
-            _make_contrib("p1", GROUP_PROJECTIONS, _StubProjection),
-            _make_contrib("p2", GROUP_PROJECTIONS, _AnotherProjection),
-        ]
-        result = _discover_projections()
-        assert result == [_StubProjection, _AnotherProjection]
-
 
 # ---------------------------------------------------------------------------
 # Tests: _group_projections_by_application
@@ -159,12 +168,6 @@ class TestGroupProjectionsByApplication:
         }
 
     def test_multiple_projections_same_app(self) -> None:
-        class _SecondStubProjection(BaseProjection):
-            upstream_application: ClassVar[type[Any]] = _StubApplication  # type: ignore[assignment]
-
-            def clear_read_model(self) -> None:
-                pass
-
         result = _group_projections_by_application([_StubProjection, _SecondStubProjection])
         assert result == {
             _StubApplication: [_StubProjection, _SecondStubProjection],
@@ -190,55 +193,73 @@ class TestGroupProjectionsByApplication:
 # ---------------------------------------------------------------------------
 
 
+_LIFESPAN_MODULE = "praecepta.infra.eventsourcing.projection_lifespan"
+
+# Spec'd runner stand-ins, built once and reset by the `patched` fixture
+_RUNNERS = (
+    create_autospec(SubscriptionProjectionRunner, instance=True),
+    create_autospec(SubscriptionProjectionRunner, instance=True),
+)
+
+
+@pytest.fixture()
+def patched(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the lifespan's collaborators with mocks for one test.
+
+    Attributes:
+        proj: ``_discover_projections``.
+        group: ``_group_projections_by_application``.
+        runner_cls: ``SubscriptionProjectionRunner`` (returns ``runners[0]``).
+        runners: Autospecced runner instances, reset for each test.
+        settings_cls: ``EventSourcingSettings`` (returns ``_mock_settings()``).
+    """
+    for runner in _RUNNERS:
+        runner.reset_mock(return_value=True, side_effect=True)
+    mocks = SimpleNamespace(
+        proj=MagicMock(),
+        group=MagicMock(),
+        runner_cls=MagicMock(return_value=_RUNNERS[0]),
+        runners=_RUNNERS,
+        settings_cls=MagicMock(return_value=_mock_settings()),
+    )
+    monkeypatch.setattr(f"{_LIFESPAN_MODULE}._discover_projections", mocks.proj)
+    monkeypatch.setattr(f"{_LIFESPAN_MODULE}._group_projections_by_application", mocks.group)
+    monkeypatch.setattr(f"{_LIFESPAN_MODULE}.SubscriptionProjectionRunner", mocks.runner_cls)
+    monkeypatch.setattr(f"{_LIFESPAN_MODULE}.EventSourcingSettings", mocks.settings_cls)
+    return mocks
+
+
 @pytest.mark.unit
 class TestProjectionRunnerLifespan:
-    @pytest.mark.asyncio
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._discover_projections")
-    async def test_no_projections_is_noop(
-        self,
-        mock_proj: MagicMock,
-    ) -> None:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_no_projections_is_noop(self, patched: SimpleNamespace) -> None:
         """When no projections found, yield without starting runners."""
-        mock_proj.return_value = []
-        async with projection_runner_lifespan(MagicMock()):
+        patched.proj.return_value = []
+        async with projection_runner_lifespan(_APP):
             pass
 
-    @pytest.mark.asyncio
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._group_projections_by_application")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._discover_projections")
-    async def test_no_grouped_projections_is_noop(
-        self,
-        mock_proj: MagicMock,
-        mock_group: MagicMock,
-    ) -> None:
+        patched.runner_cls.assert_not_called()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_no_grouped_projections_is_noop(self, patched: SimpleNamespace) -> None:
         """Projections exist but none declare upstream_application -> noop."""
-        mock_proj.return_value = [_OrphanProjection]
-        mock_group.return_value = {}
-        async with projection_runner_lifespan(MagicMock()):
+        patched.proj.return_value = [_OrphanProjection]
+        patched.group.return_value = {}
+        async with projection_runner_lifespan(_APP):
             pass
 
-    @pytest.mark.asyncio
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.EventSourcingSettings")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.SubscriptionProjectionRunner")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._group_projections_by_application")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._discover_projections")
-    async def test_one_app_one_projection_starts_and_stops(
-        self,
-        mock_proj: MagicMock,
-        mock_group: MagicMock,
-        mock_runner_cls: MagicMock,
-        mock_settings_cls: MagicMock,
-    ) -> None:
+        patched.runner_cls.assert_not_called()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_one_app_one_projection_starts_and_stops(self, patched: SimpleNamespace) -> None:
         """Single app + single projection -> one runner started then stopped."""
-        mock_proj.return_value = [_StubProjection]
-        mock_group.return_value = {_StubApplication: [_StubProjection]}
-        mock_runner = MagicMock()
-        mock_runner_cls.return_value = mock_runner
-        mock_settings_cls.return_value = _mock_settings()
-
-        async with projection_runner_lifespan(MagicMock()):
-            mock_runner_cls.assert_called_once()
-            call_kwargs = mock_runner_cls.call_args.kwargs
+        patched.proj.return_value = [_StubProjection]
+        patched.group.return_value = {_StubApplication: [_StubProjection]}
+        mock_runner = patched.runners[0]
+
+        async with projection_runner_lifespan(_APP):
+            patched.runner_cls.assert_called_once()
+            call_kwargs = patched.runner_cls.call_args.kwargs
             assert call_kwargs["projections"] == [_StubProjection]
             assert call_kwargs["upstream_application"] is _StubApplication
             assert "env" in call_kwargs
@@ -247,169 +268,101 @@ class TestProjectionRunnerLifespan:
 
         mock_runner.stop.assert_called_once()
 
-    @pytest.mark.asyncio
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.EventSourcingSettings")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.SubscriptionProjectionRunner")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._group_projections_by_application")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._discover_projections")
-    async def test_multiple_apps_creates_multiple_runners(
-        self,
-        mock_proj: MagicMock,
-        mock_group: MagicMock,
-        mock_runner_cls: MagicMock,
-        mock_settings_cls: MagicMock,
-    ) -> None:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_multiple_apps_creates_multiple_runners(self, patched: SimpleNamespace) -> None:
         """Multiple applications -> one runner per application."""
-        mock_proj.return_value = [_StubProjection, _AnotherProjection]
-        mock_group.return_value = {
+        patched.proj.return_value = [_StubProjection, _AnotherProjection]
+        patched.group.return_value = {
             _StubApplication: [_StubProjection],
             _AnotherApplication: [_AnotherProjection],
         }
-        mock_runners = [MagicMock(), MagicMock()]
-        mock_runner_cls.side_effect = mock_runners
-        mock_settings_cls.return_value = _mock_settings()
+        mock_runners = patched.runners
+        patched.runner_cls.side_effect = mock_runners
 
-        async with projection_runner_lifespan(MagicMock()):
-            assert mock_runner_cls.call_count == 2
+        async with projection_runner_lifespan(_APP):
+            assert patched.runner_cls.call_count == 2
             for runner in mock_runners:
                 runner.start.assert_called_once()
 
         for runner in mock_runners:
             runner.stop.assert_called_once()
 
-    @pytest.mark.asyncio
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.EventSourcingSettings")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.SubscriptionProjectionRunner")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._group_projections_by_application")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._discover_projections")
-    async def test_projections_grouped_by_upstream_app(
-        self,
-        mock_proj: MagicMock,
-        mock_group: MagicMock,
-        mock_runner_cls: MagicMock,
-        mock_settings_cls: MagicMock,
-    ) -> None:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_projections_grouped_by_upstream_app(self, patched: SimpleNamespace) -> None:
         """Each runner receives only its application's projections."""
-        mock_proj.return_value = [_StubProjection, _AnotherProjection]
-        mock_group.return_value = {
+        patched.proj.return_value = [_StubProjection, _AnotherProjection]
+        patched.group.return_value = {
             _StubApplication: [_StubProjection],
             _AnotherApplication: [_AnotherProjection],
         }
-        mock_runner_cls.return_value = MagicMock()
-        mock_settings_cls.return_value = _mock_settings()
 
-        async with projection_runner_lifespan(MagicMock()):
-            calls = mock_runner_cls.call_args_list
+        async with projection_runner_lifespan(_APP):
+            calls = patched.runner_cls.call_args_list
             assert calls[0].kwargs["projections"] == [_StubProjection]
             assert calls[0].kwargs["upstream_application"] is _StubApplication
             assert calls[1].kwargs["projections"] == [_AnotherProjection]
             assert calls[1].kwargs["upstream_application"] is _AnotherApplication
 
-    @pytest.mark.asyncio
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.EventSourcingSettings")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.SubscriptionProjectionRunner")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._group_projections_by_application")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._discover_projections")
-    async def test_start_failure_propagates(
-        self,
-        mock_proj: MagicMock,
-        mock_group: MagicMock,
-        mock_runner_cls: MagicMock,
-        mock_settings_cls: MagicMock,
-    ) -> None:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_start_failure_propagates(self, patched: SimpleNamespace) -> None:
         """If runner.start() raises, the exception propagates."""
-        mock_proj.return_value = [_StubProjection]
-        mock_group.return_value = {_StubApplication: [_StubProjection]}
-        mock_runner = MagicMock()
-        mock_runner.start.side_effect = RuntimeError("start failed")
-        mock_runner_cls.return_value = mock_runner
-        mock_settings_cls.return_value = _mock_settings()
+        patched.proj.return_value = [_StubProjection]
+        patched.group.return_value = {_StubApplication: [_StubProjection]}
+        patched.runners[0].start.side_effect = RuntimeError("start failed")
 
         with pytest.raises(RuntimeError, match="start failed"):
-            async with projection_runner_lifespan(MagicMock()):
+            async with projection_runner_lifespan(_APP):
                 pass  # pragma: no cover
 
-    @pytest.mark.asyncio
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.EventSourcingSettings")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.SubscriptionProjectionRunner")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._group_projections_by_application")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._discover_projections")
-    async def test_stop_called_on_exception_during_yield(
-        self,
-        mock_proj: MagicMock,
-        mock_group: MagicMock,
-        mock_runner_cls: MagicMock,
-        mock_settings_cls: MagicMock,
-    ) -> None:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_stop_called_on_exception_during_yield(self, patched: SimpleNamespace) -> None:
         """Runners are stopped even if an exception occurs during yield."""
-        mock_proj.return_value = [_StubProjection]
-        mock_group.return_value = {_StubApplication: [_StubProjection]}
-        mock_runner = MagicMock()
-        mock_runner_cls.return_value = mock_runner
-        mock_settings_cls.return_value = _mock_settings()
+        patched.proj.return_value = [_StubProjection]
+        patched.group.return_value = {_StubApplication: [_StubProjection]}
+        mock_runner = patched.runners[0]
 
         with pytest.raises(ValueError, match="app error"):
-            async with projection_runner_lifespan(MagicMock()):
+            async with projection_runner_lifespan(_APP):
                 raise ValueError("app error")
 
         mock_runner.stop.assert_called_once()
 
-    @pytest.mark.asyncio
-    @patch.dict("os.environ", {"MAX_PROJECTION_RUNNERS": "1"})
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.EventSourcingSettings")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.SubscriptionProjectionRunner")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._group_projections_by_application")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._discover_projections")
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_max_projection_runners_caps_projections(
-        self,
-        mock_proj: MagicMock,
-        mock_group: MagicMock,
-        mock_runner_cls: MagicMock,
-        mock_settings_cls: MagicMock,
+        self, patched: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """When MAX_PROJECTION_RUNNERS=1, only one projection runner starts."""
-        mock_proj.return_value = [_StubProjection, _AnotherProjection]
-        mock_group.return_value = {
+        monkeypatch.setenv("MAX_PROJECTION_RUNNERS", "1")
+        patched.proj.return_value = [_StubProjection, _AnotherProjection]
+        patched.group.return_value = {
             _StubApplication: [_StubProjection],
             _AnotherApplication: [_AnotherProjection],
         }
-        mock_runner = MagicMock()
-        mock_runner_cls.return_value = mock_runner
-        mock_settings_cls.return_value = _mock_settings()
+        mock_runner = patched.runners[0]
 
-        async with projection_runner_lifespan(MagicMock()):
+        async with projection_runner_lifespan(_APP):
             # Only 1 runner should be created due to cap
-            assert mock_runner_cls.call_count == 1
+            assert patched.runner_cls.call_count == 1
 
         mock_runner.stop.assert_called_once()
 
-    @pytest.mark.asyncio
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.EventSourcingSettings")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan.SubscriptionProjectionRunner")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._group_projections_by_application")
-    @patch("praecepta.infra.eventsourcing.projection_lifespan._discover_projections")
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_partial_start_failure_stops_already_started(
-        self,
-        mock_proj: MagicMock,
-        mock_group: MagicMock,
-        mock_runner_cls: MagicMock,
-        mock_settings_cls: MagicMock,
+        self, patched: SimpleNamespace
     ) -> None:
         """If second runner.start() fails, first runner is still stopped."""
-        mock_proj.return_value = [_StubProjection, _AnotherProjection]
-        mock_group.return_value = {
+        patched.proj.return_value = [_StubProjection, _AnotherProjection]
+        patched.group.return_value = {
             _StubApplication: [_StubProjection],
             _AnotherApplication: [_AnotherProjection],
         }
 
-        runner_ok = MagicMock()
-        runner_fail = MagicMock()
+        runner_ok, runner_fail = patched.runners
         runner_fail.start.side_effect = RuntimeError("db connection failed")
-        mock_runner_cls.side_effect = [runner_ok, runner_fail]
-        mock_settings_cls.return_value = _mock_settings()
+        patched.runner_cls.side_effect = patched.runners
 
         with pytest.raises(RuntimeError, match="db connection failed"):
-            async with projection_runner_lifespan(MagicMock()):
+            async with projection_runner_lifespan(_APP):
                 pass  # pragma: no cover
 
         runner_ok.stop.assert_called_once()
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import os
-from unittest.mock import patch
+import warnings
+from typing import TYPE_CHECKING
 
 import pytest
 
 from praecepta.infra.eventsourcing.settings import EventSourcingSettings
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
 
 @pytest.mark.unit
 class TestEventSourcingSettings:
@@ -107,106 +110,169 @@ class TestEventSourcingSettings:
         with pytest.raises(ValueError):
             self._make_settings(postgres_max_overflow=101)
 
+    @pytest.mark.usefixtures("no_pg_env")
+    def test_from_mapping(self) -> None:
+        settings = EventSourcingSettings.from_mapping(
+            {
+                "POSTGRES_DBNAME": "mapdb",
+                "POSTGRES_USER": "mapuser",
+                "POSTGRES_PASSWORD": "mappass",
+                "POSTGRES_PORT": "15432",
+                "UNRELATED": "ignored",
+            }
+        )
+        assert settings.postgres_dbname == "mapdb"
+        assert settings.postgres_port == 15432
+        assert settings.postgres_host == "localhost"
 
-@pytest.mark.unit
-class TestEventSourcingSettingsToEnvDict:
-    """Tests for to_env_dict() method."""
+    @pytest.mark.usefixtures("no_pg_env")
+    def test_from_mapping_ignores_os_environ(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("POSTGRES_HOST", "envhost")
+        monkeypatch.setenv("POSTGRES_DBNAME", "envdb")
+        settings = EventSourcingSettings.from_mapping(
+            {"POSTGRES_DBNAME": "mapdb", "POSTGRES_USER": "u", "POSTGRES_PASSWORD": "p"}
+        )
+        assert settings.postgres_dbname == "mapdb"
+        assert settings.postgres_host == "localhost"
 
-    def test_to_env_dict_basic_fields(self) -> None:
-        settings = EventSourcingSettings(
-            postgres_dbname="mydb",
-            postgres_user="user",
-            postgres_password="pass",
+    @pytest.mark.usefixtures("clean_pg_env")
+    def test_constructor_still_reads_os_environ_after_from_mapping(self) -> None:
+        EventSourcingSettings.from_mapping(
+            {"POSTGRES_DBNAME": "mapdb", "POSTGRES_USER": "u", "POSTGRES_PASSWORD": "p"}
         )
-        env = settings.to_env_dict()
+        assert EventSourcingSettings().postgres_dbname == "testdb"  # type: ignore[call-arg]
 
-        assert env["POSTGRES_DBNAME"] == "mydb"
-        assert env["POSTGRES_USER"] == "user"
-        assert env["POSTGRES_PASSWORD"] == "pass"
-        assert env["POSTGRES_HOST"] == "localhost"
-        assert env["POSTGRES_PORT"] == "5432"
 
-    def test_to_env_dict_persistence_module(self) -> None:
-        settings = EventSourcingSettings(
-            postgres_dbname="db",
-            postgres_user="user",
-            postgres_password="pass",
-        )
-        env = settings.to_env_dict()
-        assert env["PERSISTENCE_MODULE"] == "eventsourcing.postgres"
+@pytest.fixture(scope="module")
+def default_env() -> Mapping[str, str]:
+    """Env dict for settings with only the required fields given."""
+    return EventSourcingSettings(
+        postgres_dbname="mydb",
+        postgres_user="user",
+        postgres_password="pass",
+    ).to_env_dict()
 
-    def test_to_env_dict_pool_settings(self) -> None:
-        settings = EventSourcingSettings(
-            postgres_dbname="db",
-            postgres_user="user",
-            postgres_password="pass",
-            postgres_pool_size=10,
-            postgres_max_overflow=20,
-        )
-        env = settings.to_env_dict()
-        assert env["POSTGRES_POOL_SIZE"] == "10"
-        assert env["POSTGRES_MAX_OVERFLOW"] == "20"
 
-    def test_to_env_dict_create_table(self) -> None:
-        settings = EventSourcingSettings(
-            postgres_dbname="db",
-            postgres_user="user",
-            postgres_password="pass",
-            create_table=True,
-        )
-        env = settings.to_env_dict()
-        assert env["CREATE_TABLE"] == "true"
+@pytest.mark.unit
+class TestEventSourcingSettingsToEnvDict:
+    """Tests for to_env_dict() method."""
+
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            ("POSTGRES_DBNAME", "mydb"),
+            ("POSTGRES_USER", "user"),
+            ("POSTGRES_PASSWORD", "pass"),
+            ("POSTGRES_HOST", "localhost"),
+            ("POSTGRES_PORT", "5432"),
+            ("PERSISTENCE_MODULE", "eventsourcing.postgres"),
+            ("CREATE_TABLE", "true"),
+            ("POSTGRES_PRE_PING", ""),
+        ],
+    )
+    def test_to_env_dict_defaults(
+        self, default_env: Mapping[str, str], key: str, expected: str
+    ) -> None:
+        assert default_env[key] == expected
+
+    def test_to_env_dict_all_string_values(self, default_env: Mapping[str, str]) -> None:
+        for key, value in default_env.items():
+            assert isinstance(value, str), f"{key} should be str, got {type(value)}"
 
-    def test_to_env_dict_create_table_false(self) -> None:
+    @pytest.mark.parametrize(
+        ("overrides", "expected"),
+        [
+            (
+                {"postgres_pool_size": 10, "postgres_max_overflow": 20},
+                {"POSTGRES_POOL_SIZE": "10", "POSTGRES_MAX_OVERFLOW": "20"},
+            ),
+            (
+                {
+                    "postgres_port": 6543,
+                    "postgres_conn_max_age": 120,
+                    "postgres_connect_timeout": 10,
+                    "postgres_idle_in_transaction_session_timeout": 7,
+                    "postgres_lock_timeout": 0,
+                },
+                {
+                    "POSTGRES_PORT": "6543",
+                    "POSTGRES_CONN_MAX_AGE": "120",
+                    "POSTGRES_CONNECT_TIMEOUT": "10",
+                    "POSTGRES_IDLE_IN_TRANSACTION_SESSION_TIMEOUT": "7",
+                    "POSTGRES_LOCK_TIMEOUT": "0",
+                },
+            ),
+            ({"create_table": True}, {"CREATE_TABLE": "true"}),
+            ({"create_table": False}, {"CREATE_TABLE": "false"}),
+            ({"postgres_pre_ping": True}, {"POSTGRES_PRE_PING": "y"}),
+            ({"postgres_pre_ping": False}, {"POSTGRES_PRE_PING": ""}),
+        ],
+    )
+    def test_to_env_dict_overrides(
+        self, overrides: dict[str, object], expected: dict[str, str]
+    ) -> None:
         settings = EventSourcingSettings(
             postgres_dbname="db",
             postgres_user="user",
             postgres_password="pass",
-            create_table=False,
+            **overrides,  # type: ignore[arg-type]
         )
         env = settings.to_env_dict()
-        assert env["CREATE_TABLE"] == "false"
+        assert {key: env[key] for key in expected} == expected
 
-    def test_to_env_dict_pre_ping_enabled(self) -> None:
+    def test_to_env_dict_returns_independent_copies(self) -> None:
         settings = EventSourcingSettings(
-            postgres_dbname="db",
-            postgres_user="user",
-            postgres_password="pass",
-            postgres_pre_ping=True,
+            postgres_dbname="db", postgres_user="user", postgres_password="pass"
         )
         env = settings.to_env_dict()
-        assert env["POSTGRES_PRE_PING"] == "y"
+        env["POSTGRES_HOST"] = "elsewhere"
+        assert settings.to_env_dict()["POSTGRES_HOST"] == "localhost"
+        assert settings.to_env_dict() is not settings.to_env_dict()
 
-    def test_to_env_dict_pre_ping_disabled(self) -> None:
+    def test_to_env_dict_reflects_field_assignment(self) -> None:
         settings = EventSourcingSettings(
-            postgres_dbname="db",
-            postgres_user="user",
-            postgres_password="pass",
-            postgres_pre_ping=False,
+            postgres_dbname="db", postgres_user="user", postgres_password="pass"
         )
-        env = settings.to_env_dict()
-        assert env["POSTGRES_PRE_PING"] == ""
+        assert settings.to_env_dict()["POSTGRES_HOST"] == "localhost"
+        settings.postgres_host = "elsewhere"
+        assert settings.to_env_dict()["POSTGRES_HOST"] == "elsewhere"
 
-    def test_to_env_dict_all_string_values(self) -> None:
+    def test_to_env_dict_reflects_model_copy_update(self) -> None:
         settings = EventSourcingSettings(
-            postgres_dbname="db",
-            postgres_user="user",
-            postgres_password="pass",
+            postgres_dbname="db", postgres_user="user", postgres_password="pass"
         )
-        env = settings.to_env_dict()
-        for key, value in env.items():
-            assert isinstance(value, str), f"{key} should be str, got {type(value)}"
+        assert settings.to_env_dict()["POSTGRES_HOST"] == "localhost"
+        copied = settings.model_copy(update={"postgres_host": "elsewhere"})
+        assert copied.to_env_dict()["POSTGRES_HOST"] == "elsewhere"
 
 
 @pytest.mark.unit
 class TestEventSourcingSettingsProductionWarning:
     """Tests for production CREATE_TABLE warning."""
 
-    def test_warns_in_production_with_create_table_true(self) -> None:
-        with (
-            patch.dict(os.environ, {"ENVIRONMENT": "production"}),
-            pytest.warns(UserWarning, match="CREATE_TABLE=true in production"),
-        ):
+    @pytest.fixture(autouse=True)
+    def _restore_environment(self) -> Iterator[None]:
+        yield
+        EventSourcingSettings.refresh_environment()
+
+    def test_warns_in_production_with_create_table_true(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        EventSourcingSettings.refresh_environment()
+        with pytest.warns(UserWarning, match="CREATE_TABLE=true in production"):
+            EventSourcingSettings(
+                postgres_dbname="db",
+                postgres_user="user",
+                postgres_password="pass",
+                create_table=True,
+            )
+
+    def test_no_warning_in_development(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("ENVIRONMENT", "development")
+        EventSourcingSettings.refresh_environment()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
             EventSourcingSettings(
                 postgres_dbname="db",
                 postgres_user="user",
@@ -214,9 +280,16 @@ class TestEventSourcingSettingsProductionWarning:
                 create_table=True,
             )
 
-    def test_no_warning_in_development(self) -> None:
-        with patch.dict(os.environ, {"ENVIRONMENT": "development"}):
-            # Should not warn
+    def test_environment_is_not_reread_per_validation(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ENVIRONMENT", "development")
+        EventSourcingSettings.refresh_environment()
+        monkeypatch.setenv("ENVIRONMENT", "production")
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            # No refresh_environment(): the cached flag still says development
             EventSourcingSettings(
                 postgres_dbname="db",
                 postgres_user="user",
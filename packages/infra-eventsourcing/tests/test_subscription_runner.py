@@ -12,6 +12,7 @@ import pytest
 
 from praecepta.infra.eventsourcing.projections.base import BaseProjection
 from praecepta.infra.eventsourcing.projections.subscription_runner import (
+    RunnerState,
     SubscriptionProjectionRunner,
 )
 
@@ -44,6 +45,15 @@ class _AnotherProjection(BaseProjection):
         pass
 
 
+# Attributes of eventsourcing's ProjectionRunner used by the subscription runner
+_RUNNER_ATTRS = ["__enter__", "__exit__", "projection", "is_interrupted", "_thread_error"]
+
+
+def _mock_runner() -> MagicMock:
+    """Create a ProjectionRunner mock that rejects unknown attributes."""
+    return MagicMock(spec_set=_RUNNER_ATTRS)
+
+
 # ---------------------------------------------------------------------------
 # Tests: Lifecycle
 # ---------------------------------------------------------------------------
@@ -63,10 +73,28 @@ class TestSubscriptionProjectionRunnerLifecycle:
             projections=[],
             upstream_application=_FakeApp,
         )
-        runner._started = True
+        runner.state = RunnerState.RUNNING
         with pytest.raises(RuntimeError, match="already started"):
             runner.start()
 
+    def test_start_while_stopping_raises(self) -> None:
+        runner = SubscriptionProjectionRunner(
+            projections=[],
+            upstream_application=_FakeApp,
+        )
+        runner.state = RunnerState.STOPPING
+        with pytest.raises(RuntimeError, match="still stopping"):
+            runner.start()
+
+    def test_stop_while_starting_raises(self) -> None:
+        runner = SubscriptionProjectionRunner(
+            projections=[],
+            upstream_application=_FakeApp,
+        )
+        runner.state = RunnerState.STARTING
+        with pytest.raises(RuntimeError, match="still starting"):
+            runner.stop()
+
     def test_stop_when_not_started_does_not_raise(self) -> None:
         runner = SubscriptionProjectionRunner(
             projections=[],
@@ -82,8 +110,8 @@ class TestSubscriptionProjectionRunnerLifecycle:
         mock_runner_cls: MagicMock,
     ) -> None:
         """Each projection gets its own ProjectionRunner."""
-        mock_runner1 = MagicMock()
-        mock_runner2 = MagicMock()
+        mock_runner1 = _mock_runner()
+        mock_runner2 = _mock_runner()
         mock_runner_cls.side_effect = [mock_runner1, mock_runner2]
 
         runner = SubscriptionProjectionRunner(
@@ -93,6 +121,7 @@ class TestSubscriptionProjectionRunnerLifecycle:
         runner.start()
 
         assert runner.is_running
+        assert runner.state is RunnerState.RUNNING
         assert mock_runner_cls.call_count == 2
         mock_runner1.__enter__.assert_called_once()
         mock_runner2.__enter__.assert_called_once()
@@ -105,13 +134,14 @@ class TestSubscriptionProjectionRunnerLifecycle:
         mock_runner_cls: MagicMock,
     ) -> None:
         """Runners are stopped in reverse order of creation."""
-        mock_runner1 = MagicMock()
-        mock_runner1.projection = MagicMock()
-        type(mock_runner1.projection).__name__ = "Proj1"
-        mock_runner2 = MagicMock()
-        mock_runner2.projection = MagicMock()
-        type(mock_runner2.projection).__name__ = "Proj2"
+        mock_runner1 = _mock_runner()
+        mock_runner1.projection = type("Proj1", (), {})()
+        mock_runner2 = _mock_runner()
+        mock_runner2.projection = type("Proj2", (), {})()
         mock_runner_cls.side_effect = [mock_runner1, mock_runner2]
+        exit_order: list[str] = []
+        mock_runner1.__exit__.side_effect = lambda *_: exit_order.append("Proj1")
+        mock_runner2.__exit__.side_effect = lambda *_: exit_order.append("Proj2")
 
         runner = SubscriptionProjectionRunner(
             projections=[_StubProjection, _AnotherProjection],
@@ -122,6 +152,7 @@ class TestSubscriptionProjectionRunnerLifecycle:
 
         assert not runner.is_running
         # Verify reverse order: runner2 stopped before runner1
+        assert exit_order == ["Proj2", "Proj1"]
         exit_calls = [mock_runner2.__exit__, mock_runner1.__exit__]
         for exit_mock in exit_calls:
             exit_mock.assert_called_once_with(None, None, None)
@@ -134,7 +165,7 @@ class TestSubscriptionProjectionRunnerLifecycle:
         mock_runner_cls: MagicMock,
     ) -> None:
         """Context manager starts on enter, stops on exit."""
-        mock_es_runner = MagicMock()
+        mock_es_runner = _mock_runner()
         mock_runner_cls.return_value = mock_es_runner
 
         runner = SubscriptionProjectionRunner(
@@ -157,12 +188,10 @@ class TestSubscriptionProjectionRunnerLifecycle:
         mock_runner_cls: MagicMock,
     ) -> None:
         """If a runner's __exit__ raises, other runners are still stopped."""
-        mock_runner1 = MagicMock()
-        mock_runner1.projection = MagicMock()
-        type(mock_runner1.projection).__name__ = "Proj1"
-        mock_runner2 = MagicMock()
-        mock_runner2.projection = MagicMock()
-        type(mock_runner2.projection).__name__ = "Proj2"
+        mock_runner1 = _mock_runner()
+        mock_runner1.projection = type("Proj1", (), {})()
+        mock_runner2 = _mock_runner()
+        mock_runner2.projection = type("Proj2", (), {})()
         mock_runner2.__exit__.side_effect = RuntimeError("cleanup failed")
         mock_runner_cls.side_effect = [mock_runner1, mock_runner2]
 
@@ -178,6 +207,31 @@ class TestSubscriptionProjectionRunnerLifecycle:
         # runner1 still stopped despite runner2 error
         mock_runner1.__exit__.assert_called_once()
 
+    @patch("eventsourcing.projection.ProjectionRunner")
+    @patch("eventsourcing.postgres.PostgresTrackingRecorder", new_callable=lambda: MagicMock)
+    def test_failed_start_stops_entered_runners(
+        self,
+        mock_tracking_cls: MagicMock,
+        mock_runner_cls: MagicMock,
+    ) -> None:
+        """A runner failing to enter rolls back the ones already entered."""
+        mock_runner1 = _mock_runner()
+        mock_runner2 = _mock_runner()
+        mock_runner2.__enter__.side_effect = RuntimeError("connection refused")
+        mock_runner_cls.side_effect = [mock_runner1, mock_runner2]
+
+        runner = SubscriptionProjectionRunner(
+            projections=[_StubProjection, _AnotherProjection],
+            upstream_application=_FakeApp,
+        )
+        with pytest.raises(RuntimeError, match="connection refused"):
+            runner.start()
+
+        mock_runner1.__exit__.assert_called_once_with(None, None, None)
+        assert runner.state is RunnerState.IDLE
+        assert not runner.is_running
+        assert runner._runners == []
+
     @patch("eventsourcing.projection.ProjectionRunner")
     @patch("eventsourcing.postgres.PostgresTrackingRecorder", new_callable=lambda: MagicMock)
     def test_env_passed_through(
@@ -186,7 +240,7 @@ class TestSubscriptionProjectionRunnerLifecycle:
         mock_runner_cls: MagicMock,
     ) -> None:
         """Environment variables are passed to each ProjectionRunner."""
-        mock_runner_cls.return_value = MagicMock()
+        mock_runner_cls.return_value = _mock_runner()
         env = {"POSTGRES_POOL_SIZE": "2", "POSTGRES_MAX_OVERFLOW": "3"}
 
         runner = SubscriptionProjectionRunner(
@@ -203,6 +257,28 @@ class TestSubscriptionProjectionRunnerLifecycle:
             env=env,
         )
 
+    @patch("eventsourcing.projection.ProjectionRunner")
+    @patch("eventsourcing.postgres.PostgresTrackingRecorder", new_callable=lambda: MagicMock)
+    def test_start_logs_projections_in_one_record(
+        self,
+        mock_tracking_cls: MagicMock,
+        mock_runner_cls: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """All projection names are logged in a single INFO record."""
+        runner = SubscriptionProjectionRunner(
+            projections=[_StubProjection, _AnotherProjection],
+            upstream_application=_FakeApp,
+        )
+
+        with caplog.at_level(logging.INFO):
+            runner.start()
+        runner.stop()
+
+        records = [r for r in caplog.records if "_StubProjection" in r.getMessage()]
+        assert len(records) == 1
+        assert "_AnotherProjection" in records[0].getMessage()
+
     @patch("eventsourcing.projection.ProjectionRunner")
     @patch("eventsourcing.postgres.PostgresTrackingRecorder", new_callable=lambda: MagicMock)
     def test_empty_projections_list(
@@ -245,7 +321,7 @@ class TestSubscriptionProjectionRunnerHealthMonitor:
         failed_event = ThreadEvent()
         failed_event.set()
 
-        mock_runner = MagicMock()
+        mock_runner = _mock_runner()
         mock_runner.is_interrupted = failed_event
         mock_runner._thread_error = RuntimeError("DB connection refused")
         mock_runner.projection = type("BrokenProjection", (), {})()
@@ -277,7 +353,7 @@ class TestSubscriptionProjectionRunnerHealthMonitor:
         stopped_event = ThreadEvent()
         stopped_event.set()
 
-        mock_runner = MagicMock()
+        mock_runner = _mock_runner()
         mock_runner.is_interrupted = stopped_event
         mock_runner._thread_error = None
         mock_runner.projection = type("StoppedProjection", (), {})()
@@ -324,7 +400,7 @@ class TestSubscriptionProjectionRunnerHealthMonitor:
         """Normal shutdown stops monitor before runners — no spurious errors."""
         healthy_event = ThreadEvent()  # Not set — runner is healthy
 
-        mock_runner = MagicMock()
+        mock_runner = _mock_runner()
         mock_runner.is_interrupted = healthy_event
         mock_runner._thread_error = None
         mock_runner.projection = type("HealthyProjection", (), {})()
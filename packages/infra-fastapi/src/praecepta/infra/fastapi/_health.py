@@ -1,69 +1,211 @@
-"""Aggregated health check endpoint.
+"""Health check endpoints.
 
-Reports per-subsystem health status for database, Redis, and overall
-application readiness.
+``/readyz`` (aliased as ``/healthz``) reports per-subsystem health status
+for database, Redis, and overall application readiness. ``/livez`` only
+reports that the process is serving requests and performs no I/O, so it
+is safe to use as a Kubernetes liveness probe.
+
+Results are cached per application for ``_CACHE_TTL_SECONDS`` so that
+frequent probes (Kubernetes, dashboards) hit the database and Redis at
+most once per interval.
+
+:class:`LivenessMiddleware` serves the cheap liveness probe (``/livez``)
+ahead of the middleware stack; ``create_app`` installs it. Apps that
+include this router directly should add the middleware themselves.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
+
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
 
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 router = APIRouter(tags=["health"])
 logger = logging.getLogger(__name__)
 
+_CACHE_TTL_SECONDS = 1.0
+_PROBE_TIMEOUT_SECONDS = 2.0
+
+# Header tuples are shared; each response gets its own list copy, since
+# outer ASGI wrappers may append to message["headers"] in place
+_LIVEZ_BODY = b'{"status":"ok"}'
+_LIVEZ_HEADERS = (
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_LIVEZ_BODY)).encode("latin-1")),
+)
+_LIVEZ_METHODS = ("GET", "HEAD")
+_LIVEZ_NOT_ALLOWED_HEADERS = (
+    (b"allow", ", ".join(_LIVEZ_METHODS).encode("latin-1")),
+    (b"content-length", b"0"),
+)
+
+
+class _HealthCache:
+    """Last encoded health response of one application, with single-flight refresh."""
+
+    __slots__ = ("body", "expires_at", "lock", "status_code")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.expires_at = 0.0
+        self.body = b""
+        self.status_code = 200
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+def _get_health_cache(request: Request) -> _HealthCache:
+    """Return the app's health cache, creating it on first use."""
+    state = request.app.state
+    cache: _HealthCache | None = getattr(state, "health_cache", None)
+    if cache is None:
+        cache = state.health_cache = _HealthCache()
+    return cache
+
 
 async def _check_database() -> dict[str, str]:
-    """Check database connectivity via SELECT 1."""
+    """Check database connectivity via SELECT 1 on the dedicated health engine.
+
+    Gives up after ``_PROBE_TIMEOUT_SECONDS`` so a hung database fails the
+    probe instead of stalling it.
+    """
     try:
         from sqlalchemy import text
 
         from praecepta.infra.persistence.database import get_database_manager
 
         manager = get_database_manager()
-        engine = manager.get_engine()
-        async with engine.connect() as conn:
-            await conn.execute(text("SELECT 1"))
+        engine = manager.get_health_engine()
+        async with asyncio.timeout(_PROBE_TIMEOUT_SECONDS):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
         return {"status": "ok"}
+    except TimeoutError:
+        logger.warning("health_check: database timed out after %ss", _PROBE_TIMEOUT_SECONDS)
+        return {"status": "error", "detail": "timeout"}
     except Exception as exc:
         logger.warning("health_check: database unhealthy: %s", exc)
         return {"status": "error", "detail": str(exc)}
 
 
 async def _check_redis() -> dict[str, str]:
-    """Check Redis connectivity via PING."""
+    """Check Redis connectivity via PING.
+
+    Gives up after ``_PROBE_TIMEOUT_SECONDS`` so a hung Redis fails the
+    probe instead of stalling it.
+    """
     try:
         from praecepta.infra.persistence.redis_client import get_redis_factory
 
         factory = get_redis_factory()
-        client = await factory.get_client()
-        await client.ping()
+        async with asyncio.timeout(_PROBE_TIMEOUT_SECONDS):
+            client = await factory.get_client()
+            await client.ping()
         return {"status": "ok"}
+    except TimeoutError:
+        logger.warning("health_check: redis timed out after %ss", _PROBE_TIMEOUT_SECONDS)
+        return {"status": "error", "detail": "timeout"}
     except Exception as exc:
         logger.warning("health_check: redis unhealthy: %s", exc)
         return {"status": "error", "detail": str(exc)}
 
 
-@router.get("/healthz")
-async def healthz() -> Any:
-    """Aggregated health check endpoint.
+async def _run_checks() -> tuple[dict[str, Any], int]:
+    """Probe all subsystems concurrently and aggregate the result.
 
-    Returns per-subsystem status and an overall status. Returns HTTP 200
-    when all subsystems are healthy, HTTP 503 when any subsystem is degraded.
-    """
-    checks: dict[str, dict[str, str]] = {}
+    Latency is that of the slowest probe rather than their sum, and is
+    bounded by ``_PROBE_TIMEOUT_SECONDS``.
 
-    checks["database"] = await _check_database()
-    checks["redis"] = await _check_redis()
+    Returns:
+        Tuple of (response body, HTTP status code).
+    """
+    database, redis = await asyncio.gather(_check_database(), _check_redis())
+    checks: dict[str, dict[str, str]] = {"database": database, "redis": redis}
 
     all_ok = all(c["status"] == "ok" for c in checks.values())
     result = {
         "status": "ok" if all_ok else "degraded",
         "checks": checks,
     }
+    return result, 200 if all_ok else 503
+
+
+@router.get("/readyz")
+@router.get("/healthz")
+async def healthz(request: Request) -> Response:
+    """Aggregated readiness endpoint, served at ``/readyz`` and ``/healthz``.
+
+    Returns per-subsystem status and an overall status. Returns HTTP 200
+    when all subsystems are healthy, HTTP 503 when any subsystem is degraded.
+
+    A result younger than ``_CACHE_TTL_SECONDS`` is served from cache,
+    already JSON-encoded. Concurrent requests arriving after it expires
+    share one refresh.
+    """
+    cache = _get_health_cache(request)
+    if not cache.is_fresh():
+        async with cache.lock:
+            if not cache.is_fresh():
+                result, cache.status_code = await _run_checks()
+                cache.body = json.dumps(result, separators=(",", ":")).encode("utf-8")
+                cache.expires_at = time.monotonic() + _CACHE_TTL_SECONDS
+
+    return Response(
+        content=cache.body, media_type="application/json", status_code=cache.status_code
+    )
+
+
+class LivenessMiddleware:
+    """Pure ASGI middleware answering liveness probes before the app runs.
+
+    Requests to ``path`` get a constant ``{"status":"ok"}`` response
+    without entering the inner middleware (CORS, auth, request context,
+    logging) or route dispatch, and without any I/O. Methods other than
+    GET and HEAD get 405. All other requests pass through unchanged.
+
+    Register it last so it wraps every other middleware; ``create_app``
+    does this when ``AppSettings.liveness_path`` is set.
+
+    Args:
+        app: The ASGI application to wrap.
+        path: Liveness probe path (default: ``/livez``).
+    """
 
-    status_code = 200 if all_ok else 503
-    return JSONResponse(content=result, status_code=status_code)
+    def __init__(self, app: Any, path: str = "/livez") -> None:
+        self.app = app
+        self.path = path
+
+    async def __call__(
+        self,
+        scope: dict[str, Any],
+        receive: Callable[..., Any],
+        send: Callable[..., Any],
+    ) -> None:
+        if scope["type"] != "http" or scope["path"] != self.path:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method not in _LIVEZ_METHODS:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 405,
+                    "headers": list(_LIVEZ_NOT_ALLOWED_HEADERS),
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send({"type": "http.response.start", "status": 200, "headers": list(_LIVEZ_HEADERS)})
+        body = _LIVEZ_BODY if method == "GET" else b""
+        await send({"type": "http.response.body", "body": body})
@@ -7,6 +7,8 @@ error handlers, and lifespan hooks from installed praecepta packages.
 from __future__ import annotations
 
 import logging
+from functools import cache
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from starlette.middleware.cors import CORSMiddleware
@@ -18,11 +20,13 @@ from praecepta.foundation.application import (
     MiddlewareContribution,
     discover,
 )
+from praecepta.infra.fastapi._health import LivenessMiddleware
 from praecepta.infra.fastapi.lifespan import compose_lifespan
 from praecepta.infra.fastapi.settings import AppSettings
 
 if TYPE_CHECKING:
     from fastapi import APIRouter
+    from praecepta.foundation.application import DiscoveredContribution
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +37,21 @@ GROUP_ERROR_HANDLERS = "praecepta.error_handlers"
 GROUP_LIFESPAN = "praecepta.lifespan"
 
 
+@cache
+def _discover_cached(
+    group: str, exclude_names: frozenset[str]
+) -> tuple[DiscoveredContribution, ...]:
+    """Discover a group's contributions once per process.
+
+    Scanning installed distributions for entry points costs several
+    milliseconds per group, and the installed set does not change while
+    the process runs, so repeated ``create_app`` calls reuse the first
+    result. Entry points that failed to load are not retried. Call
+    ``_discover_cached.cache_clear()`` after installing packages at runtime.
+    """
+    return tuple(discover(group, exclude_names=exclude_names))
+
+
 def create_app(
     settings: AppSettings | None = None,
     *,
@@ -68,7 +87,7 @@ def create_app(
     # --- Discover lifespan hooks ---
     lifespan_hooks: list[LifespanContribution] = list(extra_lifespan_hooks or [])
     if GROUP_LIFESPAN not in _exclude_groups:
-        for contrib in discover(GROUP_LIFESPAN, exclude_names=_exclude_names):
+        for contrib in _discover_cached(GROUP_LIFESPAN, _exclude_names):
             value = contrib.value
             if isinstance(value, LifespanContribution):
                 lifespan_hooks.append(value)
@@ -103,7 +122,7 @@ def create_app(
     # --- Discover and register middleware ---
     middleware_contribs: list[MiddlewareContribution] = list(extra_middleware or [])
     if GROUP_MIDDLEWARE not in _exclude_groups:
-        for contrib in discover(GROUP_MIDDLEWARE, exclude_names=_exclude_names):
+        for contrib in _discover_cached(GROUP_MIDDLEWARE, _exclude_names):
             value = contrib.value
             if isinstance(value, MiddlewareContribution):
                 middleware_contribs.append(value)
@@ -113,8 +132,10 @@ def create_app(
                     contrib.name,
                 )
 
-    # Sort by priority ascending, then add in reverse (LIFO for Starlette)
-    middleware_contribs.sort(key=lambda m: m.priority)
+    # Sort by priority ascending, then add in reverse (LIFO for Starlette).
+    # Sorting ascending and iterating in reverse (rather than sorting with
+    # reverse=True) keeps equal priorities outermost in declaration order.
+    middleware_contribs.sort(key=attrgetter("priority"))
     for mw in reversed(middleware_contribs):
         app.add_middleware(mw.middleware_class, **mw.kwargs)
         logger.info(
@@ -123,10 +144,14 @@ def create_app(
             mw.priority,
         )
 
+    # --- Liveness probe (added last: outermost, bypasses the stack above) ---
+    if settings.liveness_path is not None:
+        app.add_middleware(LivenessMiddleware, path=settings.liveness_path)
+
     # --- Discover and register error handlers ---
     error_handler_contribs: list[ErrorHandlerContribution] = list(extra_error_handlers or [])
     if GROUP_ERROR_HANDLERS not in _exclude_groups:
-        for contrib in discover(GROUP_ERROR_HANDLERS, exclude_names=_exclude_names):
+        for contrib in _discover_cached(GROUP_ERROR_HANDLERS, _exclude_names):
             value = contrib.value
             if isinstance(value, ErrorHandlerContribution):
                 error_handler_contribs.append(value)
@@ -146,8 +171,7 @@ def create_app(
     # --- Discover and include routers ---
     routers: list[APIRouter] = list(extra_routers or [])
     if GROUP_ROUTERS not in _exclude_groups:
-        for contrib in discover(GROUP_ROUTERS, exclude_names=_exclude_names):
-            routers.append(contrib.value)
+        routers.extend(contrib.value for contrib in _discover_cached(GROUP_ROUTERS, _exclude_names))
 
     for router in routers:
         app.include_router(router)
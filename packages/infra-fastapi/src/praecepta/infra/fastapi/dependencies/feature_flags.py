@@ -62,6 +62,7 @@ def _get_feature_checker(request: Request) -> FeatureChecker:
 def require_feature(
     feature_key: str,
     *,
+    checker: FeatureChecker | None = None,
     checker_getter: Callable[[Request], FeatureChecker] | None = None,
 ) -> Callable[..., None]:
     """Create a FastAPI dependency that gates endpoint access on a feature flag.
@@ -72,8 +73,14 @@ def require_feature(
     3. Evaluates the feature flag
     4. Raises FeatureDisabledError (-> 403) if the feature is disabled
 
+    When ``checker`` is given it is bound into the dependency at creation
+    time, so requests skip the per-call lookup and FastAPI does not need
+    to inject the ``Request``.
+
     Args:
         feature_key: The feature flag key string to check.
+        checker: Optional FeatureChecker to use for every request. Use
+            this when the checker exists before routes are declared.
         checker_getter: Optional callable to retrieve the FeatureChecker
             from the request. Defaults to reading from
             ``request.app.state.feature_checker``.
@@ -81,7 +88,16 @@ def require_feature(
     Returns:
         FastAPI-compatible sync dependency function (returns None
         on success or raises FeatureDisabledError).
+
+    Raises:
+        ValueError: If both ``checker`` and ``checker_getter`` are given.
     """
+    if checker is not None:
+        if checker_getter is not None:
+            msg = "Pass either checker or checker_getter, not both"
+            raise ValueError(msg)
+        return _bound_feature_check(feature_key, checker)
+
     _get_checker = checker_getter or _get_feature_checker
 
     def _check_feature(
@@ -103,3 +119,22 @@ def require_feature(
     _check_feature.__qualname__ = f"require_feature({feature_key!r})._check_feature"
 
     return _check_feature
+
+
+def _bound_feature_check(feature_key: str, checker: FeatureChecker) -> Callable[[], None]:
+    """Build a feature dependency with the checker captured in its closure."""
+
+    def _check_feature() -> None:
+        """Evaluate feature flag for current tenant.
+
+        Raises:
+            FeatureDisabledError: If feature is disabled for the tenant.
+            NoRequestContextError: If called outside request context.
+        """
+        tenant_id = get_current_tenant_id()
+        if not checker(tenant_id, feature_key):
+            raise FeatureDisabledError(feature_key, tenant_id)
+
+    _check_feature.__qualname__ = f"require_feature({feature_key!r})._check_feature"
+
+    return _check_feature
@@ -82,7 +82,13 @@ def check_resource_limit(
 
     Returns:
         FastAPI-compatible sync dependency function returning ResourceLimitResult.
+        With neither ``usage_counter`` nor ``limit_resolver`` and a positive
+        ``default_limit`` the result does not depend on the tenant, so the
+        dependency returns a prebuilt constant without reading the request
+        context.
     """
+    if usage_counter is None and limit_resolver is None and default_limit >= 1:
+        return _unenforced_limit(resource, default_limit)
 
     def _check_limit(request: Request) -> ResourceLimitResult:
         """Enforce resource limit for current tenant.
@@ -108,7 +114,7 @@ def check_resource_limit(
             limit = default_limit
 
         # Check limit
-        if current_count + 1 > limit:
+        if current_count >= limit:
             logger.warning(
                 "resource_limit_exceeded",
                 extra={
@@ -126,15 +132,17 @@ def check_resource_limit(
 
         remaining = limit - current_count - 1
 
-        logger.debug(
-            "resource_limit_checked",
-            extra={
-                "tenant_id": tenant_id,
-                "resource": resource,
-                "limit": limit,
-                "remaining": remaining,
-            },
-        )
+        # Skip building the extra dict on the success path unless DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "resource_limit_checked",
+                extra={
+                    "tenant_id": tenant_id,
+                    "resource": resource,
+                    "limit": limit,
+                    "remaining": remaining,
+                },
+            )
 
         return ResourceLimitResult(limit=limit, remaining=remaining)
 
@@ -143,3 +151,17 @@ def check_resource_limit(
     _check_limit._resource = resource  # type: ignore[attr-defined]
 
     return _check_limit
+
+
+def _unenforced_limit(resource: str, default_limit: int) -> Callable[[], ResourceLimitResult]:
+    """Build a dependency returning the constant result for an unenforced limit."""
+    result = ResourceLimitResult(limit=default_limit, remaining=default_limit - 1)
+
+    def _check_limit() -> ResourceLimitResult:
+        """Return the prebuilt result; usage is taken as zero."""
+        return result
+
+    _check_limit.__qualname__ = f"check_resource_limit({resource!r})._check_limit"
+    _check_limit._resource = resource  # type: ignore[attr-defined]
+
+    return _check_limit
@@ -4,6 +4,9 @@ This module provides exception handlers that translate domain exceptions
 into standardized HTTP responses following RFC 7807 Problem Details for
 HTTP APIs. All handlers return responses with Content-Type: application/problem+json.
 
+The constant head of each problem type (type, title, status) is serialized
+once and reused; handlers only encode the per-request fields.
+
 Usage:
     from praecepta.infra.fastapi.error_handlers import register_exception_handlers
 
@@ -16,14 +19,16 @@ from __future__ import annotations
 import json
 import logging
 import re
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from praecepta.foundation.domain.exceptions import (
     AuthenticationError,
     AuthorizationError,
@@ -34,18 +39,29 @@ from praecepta.foundation.domain.exceptions import (
     ResourceLimitExceededError,
     ValidationError,
 )
+from praecepta.infra.fastapi.middleware.request_id import get_request_id
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from fastapi import FastAPI, Request
 
 logger = logging.getLogger(__name__)
 
 PROBLEM_MEDIA_TYPE = "application/problem+json"
 
+_JSON_SEPARATORS = (",", ":")
+
+# Retry-After sent with 429 responses (1 hour)
+_RETRY_AFTER_SECONDS = "3600"
+
 
 class ProblemDetail(BaseModel):
     """RFC 7807 Problem Details response model.
 
+    Documents the response schema for OpenAPI. The handlers below emit the
+    same shape without constructing this model on the request path.
+
     Standard fields:
     - type: URI reference identifying the problem type
     - title: Short human-readable summary
@@ -98,7 +114,11 @@ class ProblemDetail(BaseModel):
     )
 
 
-# Patterns for sensitive data
+# Context keys whose values are never included in responses
+_SENSITIVE_KEYS = frozenset({"password", "secret", "token", "api_key", "apikey", "credential"})
+
+# Patterns for sensitive data, applied one after another. Each needs its
+# own pass: a greedy value can swallow the key of a following assignment.
 _SENSITIVE_PATTERNS = [
     (
         re.compile(r"postgresql://[^@]*@[^/\s]*"),
@@ -123,22 +143,114 @@ _SENSITIVE_PATTERNS = [
 ]
 
 
-def _create_problem_response(problem: ProblemDetail) -> JSONResponse:
-    """Create JSONResponse with RFC 7807 content type.
+@dataclass(frozen=True, slots=True)
+class _ProblemTemplate:
+    """Pre-serialized constant fields of one problem type.
+
+    Attributes:
+        head: JSON object holding type, title and status, without its
+            closing brace.
+        status: HTTP status code.
+    """
+
+    head: bytes
+    status: int
+
+
+@cache
+def _problem_template(type_: str, title: str, status: int) -> _ProblemTemplate:
+    """Serialize the constant fields of a problem type once.
 
     Args:
-        problem: ProblemDetail model instance
+        type_: URI reference identifying the problem type.
+        title: Short human-readable summary.
+        status: HTTP status code.
 
     Returns:
-        JSONResponse with problem+json content type and proper status
+        Template whose head is reused by every response of this type.
     """
-    return JSONResponse(
-        status_code=problem.status,
-        content=problem.model_dump(exclude_none=True),
+    head = json.dumps(
+        {"type": type_, "title": title, "status": status},
+        ensure_ascii=False,
+        separators=_JSON_SEPARATORS,
+    )
+    return _ProblemTemplate(head=head[:-1].encode("utf-8"), status=status)
+
+
+_NOT_FOUND = _problem_template("/errors/not-found", "Resource Not Found", 404)
+_VALIDATION_ERROR = _problem_template("/errors/validation-error", "Validation Error", 422)
+_CONFLICT = _problem_template("/errors/conflict", "Conflict", 409)
+_FEATURE_DISABLED = _problem_template("/errors/feature-disabled", "Feature Disabled", 403)
+_RESOURCE_LIMIT_EXCEEDED = _problem_template(
+    "/errors/resource-limit-exceeded", "Resource Limit Exceeded", 429
+)
+_FORBIDDEN = _problem_template("/errors/forbidden", "Forbidden", 403)
+_DOMAIN_ERROR = _problem_template("/errors/domain-error", "Bad Request", 400)
+_REQUEST_VALIDATION_ERROR = _problem_template(
+    "/errors/request-validation-error", "Request Validation Error", 422
+)
+_INTERNAL_ERROR = _problem_template("/errors/internal-error", "Internal Server Error", 500)
+
+
+def _create_problem_response(
+    template: _ProblemTemplate,
+    detail: str,
+    instance: str | None,
+    error_code: str | None,
+    context: dict[str, Any] | None = None,
+    correlation_id: str | None = None,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Create a problem+json response from a template and per-request fields.
+
+    Fields that are None are omitted, matching
+    ``ProblemDetail.model_dump(exclude_none=True)``.
+
+    Args:
+        template: Pre-serialized constant fields of the problem type.
+        detail: Human-readable explanation.
+        instance: Request path of this occurrence.
+        error_code: Machine-readable error code.
+        context: Sanitized debugging information.
+        correlation_id: Request correlation ID.
+        headers: Extra response headers.
+
+    Returns:
+        Response with problem+json content type and proper status
+    """
+    fields: dict[str, Any] = {"detail": detail}
+    if instance is not None:
+        fields["instance"] = instance
+    if error_code is not None:
+        fields["error_code"] = error_code
+    if context is not None:
+        fields["context"] = context
+    if correlation_id is not None:
+        fields["correlation_id"] = correlation_id
+    tail = json.dumps(fields, ensure_ascii=False, allow_nan=False, separators=_JSON_SEPARATORS)
+    return Response(
+        content=template.head + b"," + tail[1:].encode("utf-8"),
+        status_code=template.status,
+        headers=headers,
         media_type=PROBLEM_MEDIA_TYPE,
     )
 
 
+def _instance(request: Request) -> str:
+    """Return the request path used as the problem ``instance``.
+
+    Reads the raw ASGI path instead of building ``request.url``.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        Request path
+    """
+    path: str = request.scope["path"]
+    return path
+
+
 def _get_correlation_id() -> str:
     """Get correlation ID from request context.
 
@@ -148,13 +260,7 @@ def _get_correlation_id() -> str:
     Returns:
         Correlation ID string
     """
-    try:
-        from praecepta.infra.fastapi.middleware.request_id import get_request_id
-
-        request_id = get_request_id()
-        return request_id if request_id else "unknown"
-    except ImportError:
-        return "unknown"
+    return get_request_id() or "unknown"
 
 
 def _sanitize_context(context: dict[str, Any] | None) -> dict[str, Any] | None:
@@ -168,31 +274,36 @@ def _sanitize_context(context: dict[str, Any] | None) -> dict[str, Any] | None:
         context: Context dictionary from exception
 
     Returns:
-        Sanitized context dictionary, or None if input is None
+        Sanitized context dictionary, or None if input is None or empty
     """
-    if context is None:
+    if not context:
         return None
 
-    sanitized = {}
-    for key, value in context.items():
-        # Skip sensitive keys
-        if _is_sensitive_key(key):
-            continue
-
-        # Convert types
-        sanitized[key] = _sanitize_value(value)
-
+    # Skip sensitive keys, convert the remaining values
+    sanitized = {
+        key: _sanitize_value(value)
+        for key, value in context.items()
+        if key.lower() not in _SENSITIVE_KEYS
+    }
     return sanitized if sanitized else None
 
 
 def _is_sensitive_key(key: str) -> bool:
     """Check if key name indicates sensitive data."""
-    sensitive_keys = {"password", "secret", "token", "api_key", "apikey", "credential"}
-    return key.lower() in sensitive_keys
+    return key.lower() in _SENSITIVE_KEYS
 
 
 def _sanitize_value(value: Any) -> Any:
     """Sanitize a single value for JSON serialization."""
+    # Exact-type dispatch covers the common cases in a single lookup
+    value_type = type(value)
+    if value_type in _JSON_SCALARS:
+        return value
+    convert = _VALUE_CONVERTERS.get(value_type)
+    if convert is not None:
+        return convert(value)
+
+    # Subclasses of the dispatched types
     if isinstance(value, UUID):
         return str(value)
     if isinstance(value, datetime):
@@ -202,24 +313,43 @@ def _sanitize_value(value: Any) -> Any:
     if isinstance(value, dict):
         return _sanitize_context(value)
     if isinstance(value, (list, tuple)):
-        return [_sanitize_value(v) for v in value]
-    # For other types, convert to string if not JSON-serializable
-    try:
-        json.dumps(value)
+        return _sanitize_sequence(value)
+    # Numeric subclasses (IntEnum etc.) serialize natively; anything else as a string
+    if isinstance(value, (int, float)):
         return value
-    except (TypeError, ValueError):
-        return str(value)
+    return str(value)
+
+
+def _sanitize_sequence(values: list[Any] | tuple[Any, ...]) -> list[Any]:
+    """Sanitize each item of a list or tuple."""
+    return [_sanitize_value(v) for v in values]
 
 
 def _redact_sensitive_strings(text: str) -> str:
     """Redact sensitive patterns from string values."""
-    result = text
+    # Every pattern needs an assignment or a URL scheme; most values have neither
+    if "=" not in text and "://" not in text:
+        return text
     for pattern, replacement in _SENSITIVE_PATTERNS:
-        result = pattern.sub(replacement, result)
-    return result
+        text = pattern.sub(replacement, text)
+    return text
+
+
+# Types returned unchanged by _sanitize_value
+_JSON_SCALARS = frozenset({int, float, bool, type(None)})
+
+# Exact type -> conversion applied by _sanitize_value
+_VALUE_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    str: _redact_sensitive_strings,
+    UUID: str,
+    datetime: datetime.isoformat,
+    dict: _sanitize_context,
+    list: _sanitize_sequence,
+    tuple: _sanitize_sequence,
+}
 
 
-async def not_found_handler(request: Request, exc: NotFoundError) -> JSONResponse:
+async def not_found_handler(request: Request, exc: NotFoundError) -> Response:
     """Translate NotFoundError to 404 with RFC 7807 problem details.
 
     Args:
@@ -227,24 +357,21 @@ async def not_found_handler(request: Request, exc: NotFoundError) -> JSONRespons
         exc: NotFoundError instance with resource_type and resource_id
 
     Returns:
-        JSONResponse with 404 status and problem details
+        Response with 404 status and problem details
     """
-    problem = ProblemDetail(
-        type="/errors/not-found",
-        title="Resource Not Found",
-        status=404,
-        detail=str(exc),
-        instance=str(request.url.path),
-        error_code=exc.error_code,
+    return _create_problem_response(
+        _NOT_FOUND,
+        str(exc),
+        _instance(request),
+        exc.error_code,
         context=_sanitize_context(exc.context),
     )
-    return _create_problem_response(problem)
 
 
 async def validation_error_handler(
     request: Request,
     exc: ValidationError,
-) -> JSONResponse:
+) -> Response:
     """Translate ValidationError to 422 with field-level details.
 
     Args:
@@ -252,24 +379,21 @@ async def validation_error_handler(
         exc: ValidationError instance with field and reason
 
     Returns:
-        JSONResponse with 422 status and problem details
+        Response with 422 status and problem details
     """
-    problem = ProblemDetail(
-        type="/errors/validation-error",
-        title="Validation Error",
-        status=422,
-        detail=str(exc),
-        instance=str(request.url.path),
-        error_code=exc.error_code,
+    return _create_problem_response(
+        _VALIDATION_ERROR,
+        str(exc),
+        _instance(request),
+        exc.error_code,
         context=_sanitize_context(exc.context),
     )
-    return _create_problem_response(problem)
 
 
 async def conflict_error_handler(
     request: Request,
     exc: ConflictError,
-) -> JSONResponse:
+) -> Response:
     """Translate ConflictError to 409 with conflict context.
 
     Args:
@@ -277,24 +401,21 @@ async def conflict_error_handler(
         exc: ConflictError instance with reason and version context
 
     Returns:
-        JSONResponse with 409 status and problem details
+        Response with 409 status and problem details
     """
-    problem = ProblemDetail(
-        type="/errors/conflict",
-        title="Conflict",
-        status=409,
-        detail=str(exc),
-        instance=str(request.url.path),
-        error_code=exc.error_code,
+    return _create_problem_response(
+        _CONFLICT,
+        str(exc),
+        _instance(request),
+        exc.error_code,
         context=_sanitize_context(exc.context),
     )
-    return _create_problem_response(problem)
 
 
 async def feature_disabled_handler(
     request: Request,
     exc: FeatureDisabledError,
-) -> JSONResponse:
+) -> Response:
     """Translate FeatureDisabledError to 403 Forbidden with RFC 7807 details.
 
     Response includes the feature_key in the context so clients can
@@ -305,24 +426,21 @@ async def feature_disabled_handler(
         exc: FeatureDisabledError with feature_key and tenant_id.
 
     Returns:
-        JSONResponse with 403 status and problem details.
+        Response with 403 status and problem details.
     """
-    problem = ProblemDetail(
-        type="/errors/feature-disabled",
-        title="Feature Disabled",
-        status=403,
-        detail=str(exc),
-        instance=str(request.url.path),
-        error_code=exc.error_code,
+    return _create_problem_response(
+        _FEATURE_DISABLED,
+        str(exc),
+        _instance(request),
+        exc.error_code,
         context=_sanitize_context(exc.context),
     )
-    return _create_problem_response(problem)
 
 
 async def resource_limit_handler(
     request: Request,
     exc: ResourceLimitExceededError,
-) -> JSONResponse:
+) -> Response:
     """Translate ResourceLimitExceededError to 429 with RFC 7807 + rate-limit headers.
 
     Response includes:
@@ -336,29 +454,26 @@ async def resource_limit_handler(
         exc: ResourceLimitExceededError with resource, limit, current.
 
     Returns:
-        JSONResponse with 429 status, problem details, and rate-limit headers.
+        Response with 429 status, problem details, and rate-limit headers.
     """
-    problem = ProblemDetail(
-        type="/errors/resource-limit-exceeded",
-        title="Resource Limit Exceeded",
-        status=429,
-        detail=str(exc),
-        instance=str(request.url.path),
-        error_code=exc.error_code,
+    return _create_problem_response(
+        _RESOURCE_LIMIT_EXCEEDED,
+        str(exc),
+        _instance(request),
+        exc.error_code,
         context=_sanitize_context(exc.context),
+        headers={
+            "X-RateLimit-Limit": str(exc.limit),
+            "X-RateLimit-Remaining": str(max(0, exc.limit - exc.current)),
+            "Retry-After": _RETRY_AFTER_SECONDS,
+        },
     )
 
-    response = _create_problem_response(problem)
-    response.headers["X-RateLimit-Limit"] = str(exc.limit)
-    response.headers["X-RateLimit-Remaining"] = str(max(0, exc.limit - exc.current))
-    response.headers["Retry-After"] = "3600"
-    return response
-
 
 async def authentication_error_handler(
     request: Request,
     exc: AuthenticationError,
-) -> JSONResponse:
+) -> Response:
     """Translate AuthenticationError to 401 with WWW-Authenticate header.
 
     Per RFC 6750 Section 3, all 401 responses for Bearer token errors
@@ -369,25 +484,25 @@ async def authentication_error_handler(
         exc: AuthenticationError instance with auth_error and error_code.
 
     Returns:
-        JSONResponse with 401 status, problem details, and WWW-Authenticate header.
+        Response with 401 status, problem details, and WWW-Authenticate header.
     """
-    problem = ProblemDetail(
-        type=f"/errors/{exc.error_code.lower().replace('_', '-')}",
-        title="Unauthorized",
-        status=401,
-        detail=str(exc),
-        instance=str(request.url.path),
-        error_code=exc.error_code,
+    # error_code comes from a small fixed set, so the cached templates stay bounded
+    template = _problem_template(
+        f"/errors/{exc.error_code.lower().replace('_', '-')}", "Unauthorized", 401
+    )
+    return _create_problem_response(
+        template,
+        str(exc),
+        _instance(request),
+        exc.error_code,
+        headers={"WWW-Authenticate": f'Bearer realm="API", error="{exc.auth_error}"'},
     )
-    response = _create_problem_response(problem)
-    response.headers["WWW-Authenticate"] = f'Bearer realm="API", error="{exc.auth_error}"'
-    return response
 
 
 async def authorization_error_handler(
     request: Request,
     exc: AuthorizationError,
-) -> JSONResponse:
+) -> Response:
     """Translate AuthorizationError to 403 Forbidden.
 
     Args:
@@ -395,24 +510,21 @@ async def authorization_error_handler(
         exc: AuthorizationError instance.
 
     Returns:
-        JSONResponse with 403 status and problem details.
+        Response with 403 status and problem details.
     """
-    problem = ProblemDetail(
-        type="/errors/forbidden",
-        title="Forbidden",
-        status=403,
-        detail=str(exc),
-        instance=str(request.url.path),
-        error_code=exc.error_code,
-        context=_sanitize_context(exc.context) if exc.context else None,
+    return _create_problem_response(
+        _FORBIDDEN,
+        str(exc),
+        _instance(request),
+        exc.error_code,
+        context=_sanitize_context(exc.context),
     )
-    return _create_problem_response(problem)
 
 
 async def domain_error_handler(
     request: Request,
     exc: DomainError,
-) -> JSONResponse:
+) -> Response:
     """Translate generic DomainError to 400 Bad Request.
 
     This is the fallback handler for domain errors that don't have
@@ -423,24 +535,21 @@ async def domain_error_handler(
         exc: DomainError instance
 
     Returns:
-        JSONResponse with 400 status and problem details
+        Response with 400 status and problem details
     """
-    problem = ProblemDetail(
-        type="/errors/domain-error",
-        title="Bad Request",
-        status=400,
-        detail=str(exc),
-        instance=str(request.url.path),
-        error_code=exc.error_code,
+    return _create_problem_response(
+        _DOMAIN_ERROR,
+        str(exc),
+        _instance(request),
+        exc.error_code,
         context=_sanitize_context(exc.context),
     )
-    return _create_problem_response(problem)
 
 
 async def request_validation_handler(
     request: Request,
     exc: RequestValidationError,
-) -> JSONResponse:
+) -> Response:
     """Translate Pydantic RequestValidationError to 422.
 
     This handles FastAPI's built-in validation of request bodies,
@@ -451,35 +560,31 @@ async def request_validation_handler(
         exc: RequestValidationError from Pydantic validation
 
     Returns:
-        JSONResponse with 422 status and validation error details
+        Response with 422 status and validation error details
     """
     # Format Pydantic errors for client consumption
-    errors = []
-    for error in exc.errors():
-        errors.append(
-            {
-                "loc": list(error.get("loc", [])),
-                "msg": error.get("msg", ""),
-                "type": error.get("type", ""),
-            }
-        )
-
-    problem = ProblemDetail(
-        type="/errors/request-validation-error",
-        title="Request Validation Error",
-        status=422,
-        detail="Request validation failed",
-        instance=str(request.url.path),
-        error_code="REQUEST_VALIDATION_ERROR",
+    errors = [
+        {
+            "loc": list(error.get("loc", ())),
+            "msg": error.get("msg", ""),
+            "type": error.get("type", ""),
+        }
+        for error in exc.errors()
+    ]
+
+    return _create_problem_response(
+        _REQUEST_VALIDATION_ERROR,
+        "Request validation failed",
+        _instance(request),
+        "REQUEST_VALIDATION_ERROR",
         context={"errors": errors},
     )
-    return _create_problem_response(problem)
 
 
 async def unhandled_exception_handler(
     request: Request,
     exc: Exception,
-) -> JSONResponse:
+) -> Response:
     """Catch-all handler for unhandled exceptions.
 
     Logs full exception details for debugging but returns a sanitized
@@ -493,42 +598,42 @@ async def unhandled_exception_handler(
         exc: Any unhandled exception
 
     Returns:
-        JSONResponse with 500 status and sanitized problem details
+        Response with 500 status and sanitized problem details
     """
     correlation_id = _get_correlation_id()
+    path = _instance(request)
+    exception_type = type(exc).__name__
 
     # Log full exception for debugging
-    logger.exception(
-        "unhandled_exception",
-        extra={
-            "correlation_id": correlation_id,
-            "path": str(request.url.path),
-            "method": request.method,
-            "exception_type": type(exc).__name__,
-        },
-    )
+    if logger.isEnabledFor(logging.ERROR):
+        logger.exception(
+            "unhandled_exception",
+            extra={
+                "correlation_id": correlation_id,
+                "path": path,
+                "method": request.method,
+                "exception_type": exception_type,
+            },
+        )
 
     # Build response based on debug mode
     debug_mode = getattr(request.app, "debug", False)
 
     if debug_mode:
-        detail = f"{type(exc).__name__}: {exc}"
-        context: dict[str, Any] | None = {"exception_type": type(exc).__name__}
+        detail = f"{exception_type}: {exc}"
+        context: dict[str, Any] | None = {"exception_type": exception_type}
     else:
         detail = "An internal error occurred. Please contact support with the correlation ID."
         context = None
 
-    problem = ProblemDetail(
-        type="/errors/internal-error",
-        title="Internal Server Error",
-        status=500,
-        detail=detail,
-        instance=str(request.url.path),
-        error_code="INTERNAL_ERROR",
+    return _create_problem_response(
+        _INTERNAL_ERROR,
+        detail,
+        path,
+        "INTERNAL_ERROR",
         context=context,
         correlation_id=correlation_id,
     )
-    return _create_problem_response(problem)
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -33,26 +33,19 @@ def compose_lifespan(
     Returns:
         An async context manager factory suitable for FastAPI's ``lifespan`` parameter.
     """
-    sorted_hooks = sorted(hooks, key=lambda h: h.priority)
+    ordered = tuple(
+        (contrib.priority, contrib.hook) for contrib in sorted(hooks, key=lambda h: h.priority)
+    )
 
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         async with AsyncExitStack() as stack:
-            for hook_contrib in sorted_hooks:
-                logger.info(
-                    "Entering lifespan hook (priority=%d): %r",
-                    hook_contrib.priority,
-                    hook_contrib.hook,
-                )
+            for priority, hook in ordered:
+                logger.info("Entering lifespan hook (priority=%d): %r", priority, hook)
                 try:
-                    ctx = hook_contrib.hook(app)
-                    await stack.enter_async_context(ctx)
+                    await stack.enter_async_context(hook(app))
                 except Exception:
-                    logger.exception(
-                        "Lifespan hook failed (priority=%d): %r",
-                        hook_contrib.priority,
-                        hook_contrib.hook,
-                    )
+                    logger.exception("Lifespan hook failed (priority=%d): %r", priority, hook)
                     raise
             yield
 
@@ -7,6 +7,7 @@ from praecepta.infra.fastapi.middleware.request_context import RequestContextMid
 from praecepta.infra.fastapi.middleware.request_id import (
     RequestIdMiddleware,
     get_request_id,
+    request_id_ctx,
 )
 from praecepta.infra.fastapi.middleware.tenant_state import TenantStateMiddleware
 
@@ -15,4 +16,5 @@ __all__ = [
     "RequestIdMiddleware",
     "TenantStateMiddleware",
     "get_request_id",
+    "request_id_ctx",
 ]
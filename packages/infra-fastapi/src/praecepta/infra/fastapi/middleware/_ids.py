@@ -0,0 +1,21 @@
+"""Identifier generation shared by the request middleware."""
+
+from __future__ import annotations
+
+import os
+
+
+def new_uuid4() -> str:
+    """Generate a random UUID4 string.
+
+    Formats 16 random bytes directly, producing the same text as
+    ``str(uuid.uuid4())`` without building a ``UUID`` object.
+
+    Returns:
+        Canonical hyphenated UUID4 string.
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
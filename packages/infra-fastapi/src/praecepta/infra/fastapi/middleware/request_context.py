@@ -8,13 +8,14 @@ request lifecycle.
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from praecepta.foundation.application import MiddlewareContribution
 from praecepta.foundation.application.context import (
     clear_request_context,
     set_request_context,
 )
+from praecepta.infra.fastapi.middleware._ids import new_uuid4
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -25,13 +26,8 @@ TENANT_ID_HEADER = "X-Tenant-ID"
 USER_ID_HEADER = "X-User-ID"
 CORRELATION_ID_HEADER = "X-Correlation-ID"
 
-
-def _extract_header(headers: list[tuple[bytes, bytes]], name: bytes) -> str:
-    """Extract a header value from raw ASGI headers."""
-    for key, value in headers:
-        if key.lower() == name:
-            return value.decode("latin-1")
-    return ""
+# User ID recorded when the request carries no valid X-User-ID
+_NIL_UUID = UUID(int=0)
 
 
 class RequestContextMiddleware:
@@ -59,17 +55,22 @@ class RequestContextMiddleware:
             await self.app(scope, receive, send)
             return
 
-        # Extract headers
-        headers = scope.get("headers", [])
-        tenant_id = _extract_header(headers, b"x-tenant-id")
-        user_id_str = _extract_header(headers, b"x-user-id")
-        correlation_id = _extract_header(headers, b"x-correlation-id") or str(uuid4())
+        # Extract headers (ASGI servers deliver header names lowercased).
+        # Reversed so the first of any duplicated header wins, as with
+        # Starlette's Headers.get(); a later copy must not override identity.
+        headers: dict[bytes, bytes] = dict(reversed(list(scope.get("headers", ()))))
+        tenant_id = headers.get(b"x-tenant-id", b"").decode("latin-1")
+        user_id_str = headers.get(b"x-user-id", b"").decode("latin-1")
+        correlation_id = headers.get(b"x-correlation-id", b"").decode("latin-1") or new_uuid4()
 
         # Parse user ID, default to nil UUID if not provided
-        try:
-            user_id = UUID(user_id_str) if user_id_str else UUID(int=0)
-        except ValueError:
-            user_id = UUID(int=0)
+        if not user_id_str:
+            user_id = _NIL_UUID
+        else:
+            try:
+                user_id = UUID(user_id_str)
+            except ValueError:
+                user_id = _NIL_UUID
 
         # Set context for this request
         token = set_request_context(
@@ -78,16 +79,21 @@ class RequestContextMiddleware:
             correlation_id=correlation_id,
         )
 
-        # Wrap send to inject correlation ID response header
-        async def send_with_correlation_id(message: dict[str, Any]) -> None:
-            if message["type"] == "http.response.start":
-                resp_headers = list(message.get("headers", []))
-                resp_headers.append((b"x-correlation-id", correlation_id.encode("latin-1")))
-                message = {**message, "headers": resp_headers}
-            await send(message)
+        # Wrap send to inject correlation ID response header. WebSocket
+        # scopes never send http.response.start, so they skip the wrapper.
+        app_send = send
+        if scope["type"] == "http":
+            correlation_header = (b"x-correlation-id", correlation_id.encode("latin-1"))
+
+            async def send_with_correlation_id(message: dict[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    message["headers"] = [*message.get("headers", ()), correlation_header]
+                await send(message)
+
+            app_send = send_with_correlation_id
 
         try:
-            await self.app(scope, receive, send_with_correlation_id)
+            await self.app(scope, receive, app_send)
         finally:
             clear_request_context(token)
 
@@ -8,18 +8,37 @@ request handling chain.
 
 from __future__ import annotations
 
-import uuid
+import re
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
 from praecepta.foundation.application import MiddlewareContribution
+from praecepta.infra.fastapi.middleware._ids import new_uuid4
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
+    from contextvars import Token
+
+# structlog is optional; resolve its context binding once at import time
+_bind_contextvars: Callable[..., Mapping[str, Token[Any]]] | None
+_reset_contextvars: Callable[..., None] | None
+try:
+    from structlog.contextvars import (
+        bind_contextvars as _bind_contextvars,
+        reset_contextvars as _reset_contextvars,
+    )
+except ImportError:
+    _bind_contextvars = None
+    _reset_contextvars = None
 
 # Header name constant
 REQUEST_ID_HEADER = "X-Request-ID"
 
+# Canonical hyphenated UUID; matched instead of parsing with uuid.UUID
+_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
 # Context variable for request ID propagation
 request_id_ctx: ContextVar[str] = ContextVar("request_id", default="")
 
@@ -45,8 +64,10 @@ def get_request_id() -> str:
 def _is_valid_uuid(value: str | None) -> bool:
     """Check if value is a valid UUID format.
 
-    Validates that the provided string is a valid UUID (any version).
-    Returns False for None, empty strings, or invalid formats.
+    Validates that the provided string is a canonical hyphenated UUID
+    (any version, either case). Returns False for None, empty strings,
+    or other formats, including the braced, URN and unhyphenated forms
+    that ``uuid.UUID`` would also parse.
 
     Args:
         value: String to validate as UUID.
@@ -56,11 +77,7 @@ def _is_valid_uuid(value: str | None) -> bool:
     """
     if not value:
         return False
-    try:
-        uuid.UUID(value)
-        return True
-    except (ValueError, AttributeError):
-        return False
+    return _UUID_RE.fullmatch(value) is not None
 
 
 def _extract_header(headers: list[tuple[bytes, bytes]], name: bytes) -> str:
@@ -113,13 +130,16 @@ class RequestIdMiddleware:
         request_id = _extract_header(headers, b"x-request-id")
 
         if not _is_valid_uuid(request_id):
-            request_id = str(uuid.uuid4())
+            request_id = new_uuid4()
 
         # Store in context variable
         token = request_id_ctx.set(request_id)
 
-        # Bind to structlog if available
-        _bind_to_structlog(request_id)
+        # Bind to structlog if available, keeping the tokens so the
+        # previous binding is restored afterwards
+        structlog_tokens = (
+            _bind_contextvars(request_id=request_id) if _bind_contextvars is not None else None
+        )
 
         # Wrap send to inject response header
         async def send_with_request_id(message: dict[str, Any]) -> None:
@@ -133,27 +153,8 @@ class RequestIdMiddleware:
             await self.app(scope, receive, send_with_request_id)
         finally:
             request_id_ctx.reset(token)
-            _unbind_from_structlog()
-
-
-def _bind_to_structlog(request_id: str) -> None:
-    """Bind request ID to structlog context if available."""
-    try:
-        import structlog
-
-        structlog.contextvars.bind_contextvars(request_id=request_id)
-    except ImportError:
-        pass
-
-
-def _unbind_from_structlog() -> None:
-    """Unbind request ID from structlog context if available."""
-    try:
-        import structlog
-
-        structlog.contextvars.unbind_contextvars("request_id")
-    except ImportError:
-        pass
+            if structlog_tokens is not None and _reset_contextvars is not None:
+                _reset_contextvars(**structlog_tokens)
 
 
 # Module-level contribution for auto-discovery via entry points.
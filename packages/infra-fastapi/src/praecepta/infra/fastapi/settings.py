@@ -81,6 +81,8 @@ class AppSettings(BaseSettings):
     redoc_url: str | None = Field(default="/redoc")
     openapi_url: str | None = Field(default="/openapi.json")
     debug: bool = Field(default=False)
+    # Served ahead of all middleware; None disables the liveness probe
+    liveness_path: str | None = Field(default="/livez")
     cors: CORSSettings = Field(default_factory=CORSSettings)
 
     # Discovery filtering
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 import pytest
 from fastapi import APIRouter, FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 
 if TYPE_CHECKING:
@@ -15,6 +17,7 @@ if TYPE_CHECKING:
 from praecepta.foundation.application.contributions import (
     ErrorHandlerContribution,
     LifespanContribution,
+    MiddlewareContribution,
 )
 from praecepta.infra.fastapi import AppSettings, create_app
 
@@ -146,3 +149,88 @@ class TestCreateAppExtraLifespan:
         )
         with TestClient(app):
             assert order == ["first", "second"]
+
+
+class TestCreateAppLiveness:
+    @pytest.mark.unit
+    def test_livez_bypasses_middleware(self) -> None:
+        class RejectAll:
+            def __init__(self, app: object) -> None:
+                self.app = app
+
+            async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+                response = JSONResponse({"detail": "rejected"}, status_code=401)
+                await response(scope, receive, send)
+
+        app = create_app(
+            settings=AppSettings(),
+            extra_middleware=[MiddlewareContribution(middleware_class=RejectAll)],
+            exclude_groups=_ALL_GROUPS,
+        )
+        client = TestClient(app)
+        assert client.get("/livez").json() == {"status": "ok"}
+        assert client.get("/other").status_code == 401
+
+    @pytest.mark.unit
+    def test_livez_disabled(self) -> None:
+        app = create_app(
+            settings=AppSettings(liveness_path=None),
+            exclude_groups=_ALL_GROUPS,
+        )
+        assert TestClient(app).get("/livez").status_code == 404
+
+
+class TestCreateAppDiscoveryCache:
+    @pytest.mark.unit
+    def test_entry_points_scanned_once_per_group(self) -> None:
+        with patch("praecepta.infra.fastapi.app_factory.discover", return_value=[]) as discover:
+            create_app(settings=AppSettings())
+            create_app(settings=AppSettings())
+
+        assert discover.call_count == 4
+        assert {c.args[0] for c in discover.call_args_list} == {
+            "praecepta.routers",
+            "praecepta.middleware",
+            "praecepta.error_handlers",
+            "praecepta.lifespan",
+        }
+
+    @pytest.mark.unit
+    def test_exclude_names_are_part_of_the_cache_key(self) -> None:
+        with patch("praecepta.infra.fastapi.app_factory.discover", return_value=[]) as discover:
+            create_app(settings=AppSettings())
+            create_app(settings=AppSettings(), exclude_names=frozenset({"_health_stub"}))
+
+        assert discover.call_count == 8
+
+
+class TestCreateAppMiddlewareOrder:
+    @pytest.mark.unit
+    def test_lower_priority_runs_first_and_ties_keep_declaration_order(self) -> None:
+        calls: list[str] = []
+
+        def tracer(label: str) -> type:
+            class Tracer:
+                def __init__(self, app: Any) -> None:
+                    self.app = app
+
+                async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+                    if scope["type"] == "http":
+                        calls.append(label)
+                    await self.app(scope, receive, send)
+
+            return Tracer
+
+        app = create_app(
+            settings=AppSettings(),
+            extra_middleware=[
+                MiddlewareContribution(middleware_class=tracer("late"), priority=300),
+                MiddlewareContribution(middleware_class=tracer("tie-1"), priority=200),
+                MiddlewareContribution(middleware_class=tracer("early"), priority=100),
+                MiddlewareContribution(middleware_class=tracer("tie-2"), priority=200),
+            ],
+            exclude_groups=_ALL_GROUPS,
+        )
+        TestClient(app).get("/missing")
+
+        assert calls == ["early", "tie-1", "tie-2", "late"]
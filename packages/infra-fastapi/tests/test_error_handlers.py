@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import json
+import logging
 from datetime import datetime
+from enum import IntEnum, StrEnum
 from typing import Any
 from uuid import UUID
 
@@ -23,11 +26,15 @@ from praecepta.foundation.domain import (
 from praecepta.infra.fastapi.error_handlers import (
     PROBLEM_MEDIA_TYPE,
     ProblemDetail,
+    _create_problem_response,
+    _get_correlation_id,
     _is_sensitive_key,
+    _problem_template,
     _sanitize_context,
     _sanitize_value,
     register_exception_handlers,
 )
+from praecepta.infra.fastapi.middleware.request_id import request_id_ctx
 
 
 def _make_app() -> FastAPI:
@@ -84,6 +91,50 @@ class TestProblemDetail:
         assert "correlation_id" not in data
 
 
+class TestProblemResponse:
+    @pytest.mark.unit
+    def test_body_matches_problem_detail(self) -> None:
+        template = _problem_template("/errors/test", "Test", 409)
+        resp = _create_problem_response(
+            template,
+            "détail",
+            "/widgets/1",
+            "TEST_ERROR",
+            context={"expected_version": 5},
+            correlation_id="abc",
+        )
+        expected = ProblemDetail(
+            type="/errors/test",
+            title="Test",
+            status=409,
+            detail="détail",
+            instance="/widgets/1",
+            error_code="TEST_ERROR",
+            context={"expected_version": 5},
+            correlation_id="abc",
+        )
+        assert resp.status_code == 409
+        assert resp.media_type == PROBLEM_MEDIA_TYPE
+        assert list(json.loads(resp.body)) == list(expected.model_dump(exclude_none=True))
+        assert json.loads(resp.body) == expected.model_dump(exclude_none=True)
+
+    @pytest.mark.unit
+    def test_none_fields_omitted(self) -> None:
+        template = _problem_template("/errors/test", "Test", 400)
+        resp = _create_problem_response(template, "detail", None, None)
+        assert json.loads(resp.body) == {
+            "type": "/errors/test",
+            "title": "Test",
+            "status": 400,
+            "detail": "detail",
+        }
+
+    @pytest.mark.unit
+    def test_template_is_cached(self) -> None:
+        first = _problem_template("/errors/test", "Test", 400)
+        assert _problem_template("/errors/test", "Test", 400) is first
+
+
 # ---------------------------------------------------------------------------
 # Sanitization tests
 # ---------------------------------------------------------------------------
@@ -134,6 +185,36 @@ class TestSanitization:
         assert "mysecret" not in result
         assert "REDACTED" in result
 
+    @pytest.mark.unit
+    def test_sanitize_redacts_each_pattern_in_one_string(self) -> None:
+        text = "dsn postgresql://u:p@db/x Token='t1' API-KEY=k2 Secret=s3 ok=1"
+        assert _sanitize_value(text) == (
+            "dsn postgresql://[REDACTED]@[REDACTED]/x token=[REDACTED] "
+            "api_key=[REDACTED] secret=[REDACTED] ok=1"
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("text", "secret"),
+        [
+            ("token=abc;password = hunter2", "hunter2"),
+            ("api_key=k1,secret = s3cr3t", "s3cr3t"),
+        ],
+    )
+    def test_sanitize_redacts_chained_assignments(self, text: str, secret: str) -> None:
+        result = _sanitize_value(text)
+        assert secret not in result
+        assert "REDACTED" in result
+
+    @pytest.mark.unit
+    def test_sanitize_leaves_plain_strings_untouched(self) -> None:
+        text = "token expired for user@example.com"
+        assert _sanitize_value(text) is text
+
+    @pytest.mark.unit
+    def test_connection_string_pattern_is_case_sensitive(self) -> None:
+        assert _sanitize_value("POSTGRESQL://u:p@db") == "POSTGRESQL://u:p@db"
+
     @pytest.mark.unit
     def test_sanitize_nested_dict(self) -> None:
         ctx: dict[str, Any] = {"outer": {"password": "secret", "ok": "value"}}
@@ -150,6 +231,40 @@ class TestSanitization:
         result = _sanitize_value([uid, "hello", 42])
         assert result == [str(uid), "hello", 42]
 
+    @pytest.mark.unit
+    def test_sanitize_passes_json_scalars_through(self) -> None:
+        assert _sanitize_value(None) is None
+        assert _sanitize_value(True) is True
+        assert _sanitize_value(3) == 3
+        assert _sanitize_value(1.5) == 1.5
+
+    @pytest.mark.unit
+    def test_sanitize_handles_subclasses(self) -> None:
+        class Mode(StrEnum):
+            LEAK = "password=hunter2"
+
+        class Stamp(datetime):
+            pass
+
+        assert _sanitize_value(Mode.LEAK) == "password=[REDACTED]"
+        assert _sanitize_value(Stamp(2024, 1, 15)) == "2024-01-15T00:00:00"
+
+    @pytest.mark.unit
+    def test_sanitize_tuple_to_list(self) -> None:
+        assert _sanitize_value(("a", 1)) == ["a", 1]
+
+    @pytest.mark.unit
+    def test_sanitize_non_serializable_to_string(self) -> None:
+        assert _sanitize_value({1, 2}) in ("{1, 2}", "{2, 1}")
+        assert _sanitize_value(b"raw") == "b'raw'"
+
+    @pytest.mark.unit
+    def test_sanitize_keeps_numeric_subclasses(self) -> None:
+        class Level(IntEnum):
+            HIGH = 3
+
+        assert _sanitize_value(Level.HIGH) is Level.HIGH
+
     @pytest.mark.unit
     def test_is_sensitive_key(self) -> None:
         assert _is_sensitive_key("password") is True
@@ -347,7 +462,11 @@ class TestRequestValidationHandler:
         body = resp.json()
         assert body["type"] == "/errors/request-validation-error"
         assert body["error_code"] == "REQUEST_VALIDATION_ERROR"
-        assert "errors" in body["context"]
+        errors = body["context"]["errors"]
+        assert errors
+        for error in errors:
+            assert set(error) == {"loc", "msg", "type"}
+            assert isinstance(error["loc"], list)
 
 
 class TestUnhandledExceptionHandler:
@@ -369,6 +488,34 @@ class TestUnhandledExceptionHandler:
         assert "kaboom" not in body["detail"]
         assert "correlation_id" in body
 
+    @pytest.mark.unit
+    def test_correlation_id_from_request_id_context(self) -> None:
+        token = request_id_ctx.set("req-123")
+        try:
+            assert _get_correlation_id() == "req-123"
+        finally:
+            request_id_ctx.reset(token)
+        assert _get_correlation_id() == "unknown"
+
+    @pytest.mark.unit
+    def test_logs_exception_with_request_details(self, caplog: pytest.LogCaptureFixture) -> None:
+        app = FastAPI(debug=False)
+        register_exception_handlers(app)
+
+        @app.get("/test")
+        def endpoint() -> None:
+            raise RuntimeError("kaboom")
+
+        client = TestClient(app, raise_server_exceptions=False)
+        with caplog.at_level(logging.ERROR, logger="praecepta.infra.fastapi.error_handlers"):
+            client.get("/test")
+
+        (record,) = [r for r in caplog.records if r.getMessage() == "unhandled_exception"]
+        assert record.path == "/test"  # type: ignore[attr-defined]
+        assert record.method == "GET"  # type: ignore[attr-defined]
+        assert record.exception_type == "RuntimeError"  # type: ignore[attr-defined]
+        assert record.exc_info is not None
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_returns_500_debug_mode(self) -> None:
@@ -378,14 +525,14 @@ class TestUnhandledExceptionHandler:
 
         # Create a mock request whose app.debug returns True
         mock_request = MagicMock()
-        mock_request.url.path = "/test"
+        mock_request.scope = {"path": "/test"}
         mock_request.method = "GET"
         type(mock_request.app).debug = PropertyMock(return_value=True)
 
         resp = await unhandled_exception_handler(mock_request, RuntimeError("kaboom"))
         assert resp.status_code == 500
-        import json
 
         body = json.loads(resp.body)
         assert "RuntimeError" in body["detail"]
         assert "kaboom" in body["detail"]
+        assert body["instance"] == "/test"
@@ -134,3 +134,41 @@ class TestRequireFeature:
             },
         )
         assert custom_checker_called is True
+
+    @pytest.mark.unit
+    def test_bound_checker_skips_app_state(self) -> None:
+        """A checker passed at creation time is used without app state."""
+        received: list[tuple[str, str]] = []
+
+        def checker(tenant_id: str, feature_key: str) -> bool:
+            received.append((tenant_id, feature_key))
+            return True
+
+        app = FastAPI()
+        app.add_middleware(RequestContextMiddleware)
+
+        dep = require_feature("feature.bound", checker=checker)
+
+        @app.get("/gated")
+        def endpoint(_: Annotated[None, Depends(dep)]) -> dict[str, str]:
+            return {"ok": "true"}
+
+        client = TestClient(app)
+        resp = client.get(
+            "/gated",
+            headers={
+                "X-Tenant-ID": "bound-tenant",
+                "X-User-ID": "00000000-0000-0000-0000-000000000001",
+            },
+        )
+        assert resp.status_code == 200
+        assert received == [("bound-tenant", "feature.bound")]
+
+    @pytest.mark.unit
+    def test_checker_and_getter_are_exclusive(self) -> None:
+        with pytest.raises(ValueError, match="not both"):
+            require_feature(
+                "feature.x",
+                checker=lambda tenant_id, feature_key: True,
+                checker_getter=lambda request: lambda tenant_id, feature_key: True,
+            )
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
-from praecepta.infra.fastapi._health import router
+from praecepta.infra.fastapi._health import (
+    LivenessMiddleware,
+    _check_database,
+    _check_redis,
+    router,
+)
 
 
 @pytest.fixture
@@ -84,3 +92,249 @@ class TestHealthz:
             assert resp.status_code == 503
             body = resp.json()
             assert body["status"] == "degraded"
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_subsystems_are_probed_concurrently(self, health_app: FastAPI) -> None:
+        both_started = asyncio.Barrier(2)
+
+        async def probe() -> dict[str, str]:
+            # Deadlocks (and times out) unless the other probe is running too
+            await asyncio.wait_for(both_started.wait(), timeout=1.0)
+            return {"status": "ok"}
+
+        with (
+            patch("praecepta.infra.fastapi._health._check_database", side_effect=probe),
+            patch("praecepta.infra.fastapi._health._check_redis", side_effect=probe),
+        ):
+            transport = ASGITransport(app=health_app)
+            async with AsyncClient(transport=transport, base_url="http://test") as ac:
+                resp = await ac.get("/healthz")
+            assert resp.status_code == 200
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_result_is_cached_within_ttl(self, health_app: FastAPI) -> None:
+        with (
+            patch(
+                "praecepta.infra.fastapi._health._check_database",
+                new_callable=AsyncMock,
+                return_value={"status": "ok"},
+            ) as check_db,
+            patch(
+                "praecepta.infra.fastapi._health._check_redis",
+                new_callable=AsyncMock,
+                return_value={"status": "ok"},
+            ),
+        ):
+            transport = ASGITransport(app=health_app)
+            async with AsyncClient(transport=transport, base_url="http://test") as ac:
+                first = await ac.get("/healthz")
+                second = await ac.get("/healthz")
+            assert first.json() == second.json()
+            check_db.assert_awaited_once()
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_result_is_refreshed_after_ttl(self, health_app: FastAPI) -> None:
+        with (
+            patch("praecepta.infra.fastapi._health._CACHE_TTL_SECONDS", 0.0),
+            patch(
+                "praecepta.infra.fastapi._health._check_database",
+                new_callable=AsyncMock,
+                side_effect=[{"status": "ok"}, {"status": "error", "detail": "down"}],
+            ),
+            patch(
+                "praecepta.infra.fastapi._health._check_redis",
+                new_callable=AsyncMock,
+                return_value={"status": "ok"},
+            ),
+        ):
+            transport = ASGITransport(app=health_app)
+            async with AsyncClient(transport=transport, base_url="http://test") as ac:
+                first = await ac.get("/healthz")
+                second = await ac.get("/healthz")
+            assert first.status_code == 200
+            assert second.status_code == 503
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_concurrent_requests_share_one_refresh(self, health_app: FastAPI) -> None:
+        release = asyncio.Event()
+
+        async def slow_probe() -> dict[str, str]:
+            await release.wait()
+            return {"status": "ok"}
+
+        with (
+            patch(
+                "praecepta.infra.fastapi._health._check_database", side_effect=slow_probe
+            ) as check_db,
+            patch("praecepta.infra.fastapi._health._check_redis", side_effect=slow_probe),
+        ):
+            transport = ASGITransport(app=health_app)
+            async with AsyncClient(transport=transport, base_url="http://test") as ac:
+                tasks = [asyncio.create_task(ac.get("/healthz")) for _ in range(3)]
+                await asyncio.sleep(0.05)
+                release.set()
+                responses = await asyncio.gather(*tasks)
+            assert [r.status_code for r in responses] == [200, 200, 200]
+            assert check_db.call_count == 1
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_readyz_matches_healthz(self, health_app: FastAPI) -> None:
+        with (
+            patch(
+                "praecepta.infra.fastapi._health._check_database",
+                new_callable=AsyncMock,
+                return_value={"status": "ok"},
+            ),
+            patch(
+                "praecepta.infra.fastapi._health._check_redis",
+                new_callable=AsyncMock,
+                return_value={"status": "error", "detail": "timeout"},
+            ),
+        ):
+            transport = ASGITransport(app=health_app)
+            async with AsyncClient(transport=transport, base_url="http://test") as ac:
+                readyz = await ac.get("/readyz")
+                healthz = await ac.get("/healthz")
+            assert readyz.status_code == healthz.status_code == 503
+            assert readyz.json() == healthz.json()
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_router_does_not_serve_livez(self, health_app: FastAPI) -> None:
+        transport = ASGITransport(app=health_app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            resp = await ac.get("/livez")
+        assert resp.status_code == 404
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_livez_does_not_probe_subsystems(self, health_app: FastAPI) -> None:
+        with (
+            patch(
+                "praecepta.infra.fastapi._health._check_database", new_callable=AsyncMock
+            ) as check_db,
+            patch(
+                "praecepta.infra.fastapi._health._check_redis", new_callable=AsyncMock
+            ) as check_redis,
+        ):
+            transport = ASGITransport(app=LivenessMiddleware(health_app))
+            async with AsyncClient(transport=transport, base_url="http://test") as ac:
+                resp = await ac.get("/livez")
+            assert resp.status_code == 200
+            assert resp.json() == {"status": "ok"}
+            check_db.assert_not_called()
+            check_redis.assert_not_called()
+
+
+async def _hang(*args: Any, **kwargs: Any) -> None:
+    await asyncio.Event().wait()
+
+
+@pytest.mark.unit
+class TestSubsystemProbes:
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_database_probe_times_out(self) -> None:
+        manager = MagicMock()
+        manager.get_health_engine.return_value.connect.return_value.__aenter__.side_effect = _hang
+        with (
+            patch("praecepta.infra.fastapi._health._PROBE_TIMEOUT_SECONDS", 0.01),
+            patch(
+                "praecepta.infra.persistence.database.get_database_manager",
+                return_value=manager,
+            ),
+        ):
+            result = await _check_database()
+        assert result == {"status": "error", "detail": "timeout"}
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_redis_probe_times_out(self) -> None:
+        client = MagicMock()
+        client.ping.side_effect = _hang
+        factory = MagicMock()
+        factory.get_client = AsyncMock(return_value=client)
+        with (
+            patch("praecepta.infra.fastapi._health._PROBE_TIMEOUT_SECONDS", 0.01),
+            patch(
+                "praecepta.infra.persistence.redis_client.get_redis_factory",
+                return_value=factory,
+            ),
+        ):
+            result = await _check_redis()
+        assert result == {"status": "error", "detail": "timeout"}
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_redis_probe_reports_errors(self) -> None:
+        factory = MagicMock()
+        factory.get_client = AsyncMock(side_effect=ConnectionError("refused"))
+        with patch(
+            "praecepta.infra.persistence.redis_client.get_redis_factory",
+            return_value=factory,
+        ):
+            result = await _check_redis()
+        assert result == {"status": "error", "detail": "refused"}
+
+
+@pytest.mark.unit
+class TestLivenessMiddleware:
+    @pytest.fixture
+    def inner(self) -> AsyncMock:
+        return AsyncMock()
+
+    async def _call(self, app: LivenessMiddleware, method: str, path: str) -> list[Any]:
+        sent: list[Any] = []
+
+        async def send(message: Any) -> None:
+            sent.append(message)
+
+        scope = {"type": "http", "method": method, "path": path}
+        await app(scope, AsyncMock(), send)
+        return sent
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_get_returns_ok_without_calling_app(self, inner: AsyncMock) -> None:
+        sent = await self._call(LivenessMiddleware(inner), "GET", "/livez")
+
+        assert sent[0]["status"] == 200
+        assert (b"content-type", b"application/json") in sent[0]["headers"]
+        assert json.loads(sent[1]["body"]) == {"status": "ok"}
+        inner.assert_not_called()
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_head_returns_empty_body(self, inner: AsyncMock) -> None:
+        sent = await self._call(LivenessMiddleware(inner), "HEAD", "/livez")
+
+        assert sent[0]["status"] == 200
+        assert sent[1]["body"] == b""
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_other_methods_are_not_allowed(self, inner: AsyncMock) -> None:
+        sent = await self._call(LivenessMiddleware(inner), "POST", "/livez")
+
+        assert sent[0]["status"] == 405
+        assert (b"allow", b"GET, HEAD") in sent[0]["headers"]
+        inner.assert_not_called()
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_other_paths_pass_through(self, inner: AsyncMock) -> None:
+        sent = await self._call(LivenessMiddleware(inner), "GET", "/healthz")
+
+        assert sent == []
+        inner.assert_awaited_once()
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_custom_path(self, inner: AsyncMock) -> None:
+        app = LivenessMiddleware(inner, path="/alive")
+
+        sent = await self._call(app, "GET", "/alive")
+
+        assert sent[0]["status"] == 200
+        inner.assert_not_called()
+
+    @pytest.mark.asyncio(loop_scope="function")
+    @pytest.mark.parametrize("method", ["GET", "POST"])
+    async def test_outer_header_mutation_does_not_leak(self, inner: AsyncMock, method: str) -> None:
+        app = LivenessMiddleware(inner)
+
+        first = await self._call(app, method, "/livez")
+        first[0]["headers"].append((b"x-outer", b"1"))
+        second = await self._call(app, method, "/livez")
+
+        assert (b"x-outer", b"1") not in second[0]["headers"]
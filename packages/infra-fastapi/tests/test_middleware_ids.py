@@ -0,0 +1,25 @@
+"""Unit tests for praecepta.infra.fastapi.middleware._ids."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from praecepta.infra.fastapi.middleware._ids import new_uuid4
+from praecepta.infra.fastapi.middleware.request_id import _is_valid_uuid
+
+
+class TestNewUuid4:
+    @pytest.mark.unit
+    def test_is_canonical_uuid4(self) -> None:
+        value = new_uuid4()
+        parsed = uuid.UUID(value)
+        assert str(parsed) == value
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert _is_valid_uuid(value) is True
+
+    @pytest.mark.unit
+    def test_is_random(self) -> None:
+        assert len({new_uuid4() for _ in range(100)}) == 100
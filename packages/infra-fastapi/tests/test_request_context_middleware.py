@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, WebSocket
 from fastapi.testclient import TestClient
 
 from praecepta.foundation.application.context import (
@@ -126,6 +126,24 @@ class TestRequestContextMiddleware:
         body = resp.json()
         assert body["user_id"] == str(uuid.UUID(int=0))
 
+    @pytest.mark.unit
+    def test_first_duplicate_header_wins(self) -> None:
+        app = _make_app()
+        client = TestClient(app)
+        first_user, second_user = str(uuid.uuid4()), str(uuid.uuid4())
+        resp = client.get(
+            "/context",
+            headers=[
+                (TENANT_ID_HEADER, "acme-corp"),
+                (USER_ID_HEADER, first_user),
+                (TENANT_ID_HEADER, "other-corp"),
+                (USER_ID_HEADER, second_user),
+            ],
+        )
+        body = resp.json()
+        assert body["tenant_id"] == "acme-corp"
+        assert body["user_id"] == first_user
+
     @pytest.mark.unit
     def test_context_cleared_after_request(self) -> None:
         app = _make_app()
@@ -137,6 +155,31 @@ class TestRequestContextMiddleware:
         # After request completes, context should be cleared
         assert request_context.get() is None
 
+    @pytest.mark.unit
+    def test_websocket_sees_context(self) -> None:
+        app = FastAPI()
+        app.add_middleware(RequestContextMiddleware)
+
+        @app.websocket("/ws")
+        async def ws_endpoint(websocket: WebSocket) -> None:
+            await websocket.accept()
+            await websocket.send_json(
+                {
+                    "tenant_id": get_current_tenant_id(),
+                    "correlation_id": get_current_correlation_id(),
+                }
+            )
+            await websocket.close()
+
+        client = TestClient(app)
+        with client.websocket_connect(
+            "/ws",
+            headers={TENANT_ID_HEADER: "acme-corp", CORRELATION_ID_HEADER: "corr-ws"},
+        ) as ws:
+            body = ws.receive_json()
+        assert body == {"tenant_id": "acme-corp", "correlation_id": "corr-ws"}
+        assert request_context.get() is None
+
 
 class TestContextAccessorFunctions:
     @pytest.mark.unit
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import uuid
+from typing import Any
 
 import pytest
 from fastapi import FastAPI
@@ -54,6 +55,24 @@ class TestIsValidUUID:
     def test_partial_uuid(self) -> None:
         assert _is_valid_uuid("12345678-1234") is False
 
+    @pytest.mark.unit
+    def test_uppercase_uuid(self) -> None:
+        assert _is_valid_uuid(str(uuid.uuid4()).upper()) is True
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "{12345678-1234-5678-1234-567812345678}",
+            "urn:uuid:12345678-1234-5678-1234-567812345678",
+            "12345678123456781234567812345678",
+            "12345678-1234-5678-1234-567812345678\n",
+            "1234567g-1234-5678-1234-567812345678",
+        ],
+    )
+    def test_non_canonical_forms(self, value: str) -> None:
+        assert _is_valid_uuid(value) is False
+
 
 class TestRequestIdMiddleware:
     @pytest.mark.unit
@@ -108,3 +127,86 @@ class TestRequestIdMiddleware:
     def test_get_request_id_outside_context(self) -> None:
         # Outside of middleware, get_request_id returns empty string
         assert get_request_id() == ""
+
+
+class TestStructlogBinding:
+    @pytest.mark.unit
+    def test_binds_request_id_during_request(self) -> None:
+        structlog = pytest.importorskip("structlog")
+
+        app = FastAPI()
+        app.add_middleware(RequestIdMiddleware)
+
+        @app.get("/test")
+        def endpoint() -> dict[str, str]:
+            return {"bound": structlog.contextvars.get_contextvars().get("request_id", "")}
+
+        client = TestClient(app)
+        request_id = str(uuid.uuid4())
+        resp = client.get("/test", headers={REQUEST_ID_HEADER: request_id})
+        assert resp.json()["bound"] == request_id
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_unbinds_request_id_after_request(self) -> None:
+        structlog = pytest.importorskip("structlog")
+        structlog.contextvars.clear_contextvars()
+
+        async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+            assert "request_id" in structlog.contextvars.get_contextvars()
+
+        async def send(message: dict[str, Any]) -> None:
+            pass
+
+        middleware = RequestIdMiddleware(app)
+        await middleware({"type": "http", "headers": []}, None, send)
+        assert "request_id" not in structlog.contextvars.get_contextvars()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_restores_outer_request_id_after_request(self) -> None:
+        structlog = pytest.importorskip("structlog")
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(request_id="outer")
+        inner: dict[str, Any] = {}
+
+        async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+            inner.update(structlog.contextvars.get_contextvars())
+
+        async def send(message: dict[str, Any]) -> None:
+            pass
+
+        middleware = RequestIdMiddleware(app)
+        try:
+            await middleware({"type": "http", "headers": []}, None, send)
+            assert inner["request_id"] != "outer"
+            assert structlog.contextvars.get_contextvars()["request_id"] == "outer"
+        finally:
+            structlog.contextvars.clear_contextvars()
+
+
+class TestPublicExports:
+    @pytest.mark.unit
+    def test_package_reexports_module_objects(self) -> None:
+        from praecepta.infra.fastapi import middleware
+        from praecepta.infra.fastapi.middleware import request_id
+
+        assert middleware.request_id_ctx is request_id.request_id_ctx
+        assert middleware.get_request_id is request_id.get_request_id
+        assert middleware.RequestIdMiddleware is request_id.RequestIdMiddleware
+
+    @pytest.mark.unit
+    def test_public_context_var_is_set_by_middleware(self) -> None:
+        from praecepta.infra.fastapi.middleware import request_id_ctx as public_ctx
+
+        app = FastAPI()
+        app.add_middleware(RequestIdMiddleware)
+
+        @app.get("/test")
+        def endpoint() -> dict[str, str]:
+            return {"request_id": public_ctx.get()}
+
+        client = TestClient(app)
+        request_id = str(uuid.uuid4())
+        resp = client.get("/test", headers={REQUEST_ID_HEADER: request_id})
+        assert resp.json()["request_id"] == request_id
@@ -4,6 +4,7 @@
 # FastAPI Depends() + Annotated requires runtime-evaluable annotations.
 # PEP 563 deferred evaluation breaks this under pytest --import-mode=importlib.
 
+import logging
 from typing import Annotated
 
 import pytest
@@ -173,3 +174,56 @@ class TestCheckResourceLimit:
             },
         )
         assert resp.status_code == 429
+
+    @pytest.mark.unit
+    def test_success_logged_at_debug(self, caplog: pytest.LogCaptureFixture) -> None:
+        app = _make_app(limit_resolver=lambda req, tid, res: 10)
+        client = TestClient(app)
+        with caplog.at_level(
+            logging.DEBUG, logger="praecepta.infra.fastapi.dependencies.resource_limits"
+        ):
+            client.post(
+                "/create",
+                headers={
+                    "X-Tenant-ID": "acme-corp",
+                    "X-User-ID": "00000000-0000-0000-0000-000000000001",
+                },
+            )
+        records = [r for r in caplog.records if r.getMessage() == "resource_limit_checked"]
+        assert len(records) == 1
+        assert records[0].remaining == 9  # type: ignore[attr-defined]
+
+    @pytest.mark.unit
+    def test_unenforced_limit_returns_constant_without_context(self) -> None:
+        """With no counter or resolver, no request context is required."""
+        app = FastAPI()
+        dep = check_resource_limit("test_resource", default_limit=5)
+
+        @app.post("/create")
+        def create_endpoint(
+            result: Annotated[ResourceLimitResult, Depends(dep)],
+        ) -> dict[str, int]:
+            return {"limit": result.limit, "remaining": result.remaining}
+
+        resp = TestClient(app).post("/create")
+        assert resp.status_code == 200
+        assert resp.json() == {"limit": 5, "remaining": 4}
+
+    @pytest.mark.unit
+    def test_zero_default_limit_without_counter_returns_429(self) -> None:
+        """A non-positive default limit is still enforced on the constant path."""
+        from praecepta.infra.fastapi.error_handlers import register_exception_handlers
+
+        app = _make_app(default_limit=0)
+        register_exception_handlers(app)
+
+        client = TestClient(app, raise_server_exceptions=False)
+        resp = client.post(
+            "/create",
+            headers={
+                "X-Tenant-ID": "acme-corp",
+                "X-User-ID": "00000000-0000-0000-0000-000000000001",
+            },
+        )
+        assert resp.status_code == 429
+        assert resp.json()["error_code"] == "RESOURCE_LIMIT_EXCEEDED"
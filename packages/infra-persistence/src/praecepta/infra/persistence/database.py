@@ -137,6 +137,7 @@ class DatabaseManager:
     def __init__(self, settings: DatabaseSettings) -> None:
         self._settings = settings
         self._engine: AsyncEngine | None = None
+        self._health_engine: AsyncEngine | None = None
         self._session_factory: async_sessionmaker[AsyncSession] | None = None
         self._sync_engine: Engine | None = None
         self._sync_session_factory: sessionmaker[Session] | None = None
@@ -165,6 +166,29 @@ class DatabaseManager:
             )
         return self._engine
 
+    def get_health_engine(self) -> AsyncEngine:
+        """Get or create the async engine reserved for health checks.
+
+        Holds a single connection kept apart from the main pool, so a
+        saturated application pool does not fail readiness probes, and a
+        probe does not queue behind application queries. Pre-ping is off:
+        the probe query itself is the liveness check.
+
+        Returns:
+            AsyncEngine with a one-connection pool.
+        """
+        if self._health_engine is None:
+            s = self._settings
+            self._health_engine = create_async_engine(
+                s.database_url,
+                pool_size=1,
+                max_overflow=0,
+                pool_timeout=s.pool_timeout,
+                pool_recycle=s.pool_recycle,
+                echo=s.echo,
+            )
+        return self._health_engine
+
     def get_session_factory(self) -> async_sessionmaker[AsyncSession]:
         """Get or create the async session factory.
 
@@ -236,6 +260,9 @@ class DatabaseManager:
             await self._engine.dispose()
             self._engine = None
             self._session_factory = None
+        if self._health_engine is not None:
+            await self._health_engine.dispose()
+            self._health_engine = None
         if self._sync_engine is not None:
             self._sync_engine.dispose()
             self._sync_engine = None
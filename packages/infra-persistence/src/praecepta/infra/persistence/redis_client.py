@@ -126,7 +126,10 @@ class RedisFactory:
         """Create Redis async client with explicit connection pool.
 
         Creates a ConnectionPool explicitly and passes it to Redis() for
-        deterministic lifecycle management (CF-22).
+        deterministic lifecycle management (CF-22). Pooled sockets use TCP
+        keepalive and are re-validated after sitting idle, so callers
+        (including health probes) reuse warm connections instead of
+        reconnecting.
 
         Returns:
             Configured async Redis client with explicit pool.
@@ -138,6 +141,8 @@ class RedisFactory:
             max_connections=self._settings.redis_pool_size,
             socket_timeout=self._settings.redis_socket_timeout,
             socket_connect_timeout=self._settings.redis_socket_connect_timeout,
+            socket_keepalive=self._settings.redis_socket_keepalive,
+            health_check_interval=self._settings.redis_health_check_interval,
             decode_responses=False,
         )
         client: Any = aioredis.Redis(connection_pool=self._pool)
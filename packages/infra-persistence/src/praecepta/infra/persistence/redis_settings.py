@@ -30,6 +30,10 @@ class RedisSettings(BaseSettings):
         REDIS_POOL_SIZE: Maximum connections in pool (default: 10)
         REDIS_SOCKET_TIMEOUT: Socket timeout in seconds (default: 5.0)
         REDIS_SOCKET_CONNECT_TIMEOUT: Connection timeout in seconds (default: 5.0)
+        REDIS_SOCKET_KEEPALIVE: Enable TCP keepalive on pooled sockets
+            (default: true)
+        REDIS_HEALTH_CHECK_INTERVAL: Seconds a pooled connection may sit idle
+            before it is pinged on checkout; 0 disables (default: 30)
 
     Example:
         >>> settings = RedisSettings(redis_host='localhost', redis_port=6379)
@@ -92,6 +96,15 @@ class RedisSettings(BaseSettings):
         ge=0.1,
         description="Connection timeout in seconds",
     )
+    redis_socket_keepalive: bool = Field(
+        default=True,
+        description="Enable TCP keepalive on pooled sockets",
+    )
+    redis_health_check_interval: int = Field(
+        default=30,
+        ge=0,
+        description="Idle seconds before a pooled connection is pinged on checkout",
+    )
 
     @field_validator("redis_port")
     @classmethod
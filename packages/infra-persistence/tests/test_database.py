@@ -120,6 +120,24 @@ class TestDatabaseManager:
             assert m2.settings.name == "db2"
             assert m1 is not m2
 
+    @pytest.mark.unit
+    def test_health_engine_has_single_connection_pool(self) -> None:
+        with patch.dict("os.environ", {}, clear=True):
+            manager = DatabaseManager(DatabaseSettings())  # type: ignore[call-arg]
+            engine = manager.get_health_engine()
+            assert engine is manager.get_health_engine()
+            assert engine is not manager.get_engine()
+            assert engine.pool.size() == 1  # type: ignore[attr-defined]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_dispose_releases_health_engine(self) -> None:
+        with patch.dict("os.environ", {}, clear=True):
+            manager = DatabaseManager(DatabaseSettings())  # type: ignore[call-arg]
+            engine = manager.get_health_engine()
+            await manager.dispose()
+            assert manager.get_health_engine() is not engine
+
 
 class TestGetDatabaseManager:
     @pytest.mark.unit
@@ -57,6 +57,9 @@ class TestRedisFactory:
             client2 = await factory.get_client()
             assert client2 is mock_client
             mock_pool_cls.from_url.assert_called_once()
+            pool_kwargs = mock_pool_cls.from_url.call_args.kwargs
+            assert pool_kwargs["socket_keepalive"] is True
+            assert pool_kwargs["health_check_interval"] == settings.redis_health_check_interval
 
     @pytest.mark.asyncio(loop_scope="function")
     async def test_close_cleans_up_client_and_pool(self) -> None:
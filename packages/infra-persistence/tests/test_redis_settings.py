@@ -19,6 +19,8 @@ class TestRedisSettings:
             assert settings.redis_db == 0
             assert settings.redis_password is None
             assert settings.redis_pool_size == 10
+            assert settings.redis_socket_keepalive is True
+            assert settings.redis_health_check_interval == 30
 
     @pytest.mark.unit
     def test_get_url_without_password(self) -> None:
@@ -163,17 +163,17 @@ def _set_env(monkeypatch, _eventsourcing_env, _database_env, _redis_env):
 
 @pytest.fixture(autouse=True)
 def _clear_caches():
-    """Clear LRU-cached singletons so each test gets fresh instances."""
-    from praecepta.infra.eventsourcing.event_store import get_event_store
+    """Clear cached singletons so each test gets fresh instances."""
+    from praecepta.infra.eventsourcing.event_store import _reset_event_store
     from praecepta.infra.persistence.database import get_database_manager
     from praecepta.infra.persistence.redis_client import get_redis_factory
 
     get_database_manager.cache_clear()
-    get_event_store.cache_clear()
+    _reset_event_store()
     get_redis_factory.cache_clear()
     yield
     get_database_manager.cache_clear()
-    get_event_store.cache_clear()
+    _reset_event_store()
     get_redis_factory.cache_clear()
 
 
@@ -40,8 +40,21 @@ class TestHybridConfigCacheRedis:
         assert result == {"value": 42}
 
         # Verify L1 was repopulated
-        l1_key = cache._cache_key("tenant-b", "config-key")
-        assert l1_key in cache._l1
+        assert ("tenant-b", "config-key") in cache._l1
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_multi_set_and_multi_get_round_trip(self, redis_client):
+        """Batch-write, clear L1, verify one MGET serves every key."""
+        cache = HybridConfigCache(redis_client=redis_client)
+
+        await cache.multi_set("tenant-f", {"key1": {"a": 1}, "key2": {"b": 2}})
+        cache._l1.clear()
+        assert "tenant-f" not in cache._l1.tenant_keys
+
+        result = await cache.multi_get("tenant-f", ["key1", "key2", "missing"])
+
+        assert result == {"key1": {"a": 1}, "key2": {"b": 2}}
+        assert cache._l1.tenant_keys["tenant-f"] == {"key1", "key2"}
 
     @pytest.mark.asyncio(loop_scope="function")
     async def test_invalidate_removes_from_both_levels(self, redis_client):